@@ -1,8 +1,9 @@
 import streamlit as st
 from visualizations import show_interactive_map
+from images import image_url
 
 def show_about():
-    bg_image_url = "https://raw.githubusercontent.com/iffathsaleem/DSPL_ICW/main/Images/About.jpg"
+    bg_image_url = image_url("About.jpg")
     
     st.markdown(
         f"""
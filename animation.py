@@ -0,0 +1,198 @@
+import logging
+import math
+import os
+from collections import namedtuple
+
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+from plotly.io.json import to_json_plotly
+from category_store import get_category_partition
+from downsampling import downsample_series
+from data_store import versioned_cache
+
+logger = logging.getLogger(__name__)
+
+# "cumulative": every frame carries each trace up to its year
+# "stepped": cumulative, but with at most ANIMATION_MAX_FRAMES frames
+# "cursor": traces are shipped once; frames only move the x-axis range
+ANIMATION_MODES = ("cumulative", "stepped", "cursor")
+ANIMATION_MODE = os.environ.get("HEALTH_ANIMATION_MODE", "cumulative")
+ANIMATION_MAX_FRAMES = int(os.environ.get("HEALTH_ANIMATION_MAX_FRAMES", "16"))
+# Show the payload comparison of the animation modes under each trend chart
+ANIMATION_DEBUG = os.environ.get("HEALTH_ANIMATION_DEBUG", "0") == "1"
+
+TrendFrames = namedtuple("TrendFrames", ["years", "indicators", "codes", "series", "frames", "mode", "payload_bytes", "dense"])
+
+def frame_years(years, max_frames=None):
+    """
+    Picks evenly stepped years so there are at most max_frames, always
+    keeping the last year.
+    """
+    if not max_frames or len(years) <= max_frames:
+        return years
+    step = math.ceil(len(years) / max_frames)
+    picked = years[::step]
+    if picked[-1] != years[-1]:
+        picked = np.append(picked[:max_frames - 1], years[-1])
+    return picked
+
+def payload_bytes(payload):
+    """
+    Returns the size of a Plotly object or dict once serialized to JSON.
+    """
+    return len(to_json_plotly(payload).encode("utf-8"))
+
+def build_trend_frames(matrix, year_range=None, mode="cumulative", max_frames=None):
+    """
+    Builds animation frames for every indicator of a matrix.
+
+    Each indicator's non-missing values are extracted once as sorted arrays;
+    a cumulative frame then takes a prefix of every array, found by
+    searchsorted. Years in which no indicator has a value get no frame.
+    Above the dense point threshold the arrays are LTTB-downsampled first
+    and the frames use WebGL traces.
+
+    Args:
+        matrix (HealthMatrix): Matrix holding the indicators to animate
+        year_range (tuple): Inclusive (start, end) years; None keeps all years
+        mode (str): One of ANIMATION_MODES
+        max_frames (int): Frame cap for the "stepped" mode
+
+    Returns:
+        TrendFrames: Frame years, indicator names and codes, per-indicator
+            (years, values) arrays, the frames as plain Plotly dicts, the
+            mode and the frames' serialized size in bytes
+    """
+    if mode not in ANIMATION_MODES:
+        raise ValueError(f"Unknown animation mode '{mode}', expected one of {ANIMATION_MODES}")
+    if year_range is not None:
+        matrix = matrix.slice(years=year_range)
+    present = ~np.isnan(matrix.values)
+    columns = np.nonzero(present.any(axis=0))[0]
+    years = matrix.years[present[:, columns].any(axis=1)] if len(columns) else matrix.years[:0]
+
+    indicators = [matrix.indicators[column] for column in columns]
+    codes = [
+        matrix.info['Indicator_Code'].get(name, name) if 'Indicator_Code' in matrix.info else name
+        for name in indicators
+    ]
+    series = [
+        (matrix.years[present[:, column]], matrix.values[present[:, column], column])
+        for column in columns
+    ]
+    series, dense = downsample_series(series)
+    trace_type = "scattergl" if dense else "scatter"
+
+    if mode == "stepped":
+        years = frame_years(years, max_frames)
+
+    frames = []
+    for year in years:
+        if mode == "cursor":
+            first_year = matrix.years[0] if len(matrix.years) else year
+            frames.append({"name": str(year), "layout": {"xaxis": {"range": [first_year - 1, year + 1]}}})
+            continue
+        data = []
+        for x, y in series:
+            end = np.searchsorted(x, year, side='right')
+            data.append({"type": trace_type, "x": x[:end], "y": y[:end]})
+        frames.append({"name": str(year), "data": data})
+
+    return TrendFrames(years, indicators, codes, series, frames, mode, payload_bytes(frames), dense)
+
+def trend_traces(trend_frames):
+    """
+    Returns the full-series line traces for the indicators of a TrendFrames,
+    as WebGL lines without markers when its series are dense.
+    """
+    colors = px.colors.qualitative.Plotly
+    trace = go.Scattergl if trend_frames.dense else go.Scatter
+    return [
+        trace(
+            x=x,
+            y=y,
+            name=code,
+            mode='lines' if trend_frames.dense else 'lines+markers',
+            marker=dict(size=10),
+            line=dict(width=4),
+            marker_color=colors[i % len(colors)],
+            hovertemplate=f"{name}<br>Year: %{{x}}<br>Value: %{{y}}",
+            customdata=[name] * len(x)
+        )
+        for i, (name, code, (x, y)) in enumerate(zip(trend_frames.indicators, trend_frames.codes, trend_frames.series))
+    ]
+
+@versioned_cache(max_entries=128)
+def _category_trend_frames(data, category, year_range, mode, max_frames):
+    partition = get_category_partition(data, category)
+    if partition is None:
+        return None
+    return build_trend_frames(partition.matrix, year_range, mode, max_frames)
+
+def get_category_trend_frames(data, category_name, year_range=None, mode=None, max_frames=None):
+    """
+    Returns the TrendFrames of a category, built once per category, year range,
+    animation settings and data version.
+
+    Args:
+        data (pd.DataFrame): The frame returned by load_data
+        category_name (str): Category, with or without the " Analysis" suffix
+        year_range (tuple): Inclusive (start, end) years; None keeps all years
+        mode (str): One of ANIMATION_MODES; defaults to ANIMATION_MODE
+        max_frames (int): Frame cap; defaults to ANIMATION_MAX_FRAMES
+
+    Returns:
+        TrendFrames: The category's frames, or None when it has no data
+    """
+    category = category_name.replace(" Analysis", "")
+    return _category_trend_frames(
+        data, category, year_range, mode or ANIMATION_MODE, max_frames or ANIMATION_MAX_FRAMES
+    )
+
+def payload_report(data, category_name, year_range=None):
+    """
+    Compares the frame payload of the configured animation mode with full
+    cumulative frames.
+
+    Returns:
+        dict: mode, frame counts and payload bytes before ("cumulative")
+            and after (configured mode), or None when the category has no data
+    """
+    after = get_category_trend_frames(data, category_name, year_range)
+    before = get_category_trend_frames(data, category_name, year_range, mode="cumulative")
+    if after is None:
+        return None
+    return {
+        "mode": after.mode,
+        "frames_before": len(before.frames),
+        "frames_after": len(after.frames),
+        "bytes_before": before.payload_bytes,
+        "bytes_after": after.payload_bytes
+    }
+
+def format_payload_report(report):
+    """
+    Formats a payload_report as a one-line caption.
+    """
+    saved = (1 - report["bytes_after"] / report["bytes_before"]) * 100 if report["bytes_before"] else 0
+    return (
+        f"Animation payload ({report['mode']}): {report['bytes_after'] / 1024:,.1f} KB in "
+        f"{report['frames_after']} frames, vs {report['bytes_before'] / 1024:,.1f} KB in "
+        f"{report['frames_before']} cumulative frames ({saved:.0f}% smaller)"
+    )
+
+def payload_caption(data, category_name, year_range=None):
+    """
+    Logs the payload_report of a category and returns it as a caption when
+    HEALTH_ANIMATION_DEBUG is set; returns None otherwise, without building
+    the comparison frames.
+    """
+    if not ANIMATION_DEBUG:
+        return None
+    report = payload_report(data, category_name, year_range)
+    if report is None:
+        return None
+    caption = format_payload_report(report)
+    logger.info("%s: %s", category_name, caption)
+    return caption
@@ -1,3 +1,4 @@
+import os
 import streamlit as st
 import pandas as pd
 from sidebar import show_sidebar, set_section_background, SECTION_BACKGROUNDS
@@ -7,18 +8,54 @@ from dashboard import (
     show_category_analysis
 )
 from about import show_about
-from categories import categories, map_category
-from visualizations import show_interactive_map, show_comparative_section
+from categories import categories
+from data_store import DATA_PATH, load_health_data, load_partitioned_data, compact_health_data
+from data_reloader import DatasetReloader
+from health_matrix import get_health_matrix
+from category_store import get_category_partitions
+from filter_engine import get_filter_engine
+from kpi import get_kpis
+from forecasting import prefit_forecasts
+from correlations import get_correlation_matrix
+from visualizations import show_interactive_map, show_comparative_section, rerun_for_pending
 from summary import show_summary 
 
-@st.cache_data
+# Opt-in compact memory layout: "1" for categoricals/int16, "float32" to also downcast values
+COMPACT_DATA = os.environ.get("HEALTH_DATA_COMPACT", "").lower()
+# Optional partitioned multi-country dataset written by `ingest.py --partition-dir`
+PARTITION_ROOT = os.environ.get("HEALTH_DATA_PARTITIONS")
+COUNTRY = os.environ.get("HEALTH_DATA_COUNTRY", "LKA")
+
+# Sessions get shallow copies of the shared dataset; copy-on-write makes any
+# write to one copy its own blocks instead of the frame every session reads
+pd.set_option("mode.copy_on_write", True)
+
+# Seconds between checks for a refreshed dataset; 0 disables hot reloading
+RELOAD_INTERVAL = float(os.environ.get("HEALTH_DATA_RELOAD_INTERVAL", "5"))
+
+def read_dataset():
+    compact = COMPACT_DATA in ("1", "true", "float32")
+    if PARTITION_ROOT:
+        health = load_partitioned_data(PARTITION_ROOT, countries=[COUNTRY])
+        return compact_health_data(health, COMPACT_DATA == "float32") if compact else health
+    return load_health_data(
+        DATA_PATH,
+        compact=compact,
+        float32_values=COMPACT_DATA == "float32"
+    )
+
+@st.cache_resource(show_spinner=False)
+def get_data_reloader():
+    return DatasetReloader(
+        read_dataset,
+        PARTITION_ROOT or DATA_PATH,
+        interval=RELOAD_INTERVAL,
+        warmers=[get_health_matrix, get_category_partitions, get_filter_engine, get_kpis, get_correlation_matrix, prefit_forecasts]
+    ).start()
+
 def load_data():
     try:
-        health = pd.read_csv("Sri Lanka Health Statistics.csv")
-        health["Value"] = pd.to_numeric(health["Value"], errors='coerce')
-        health["Year"] = health["Year"].astype(int)
-        health["Category"] = health["Indicator Name"].apply(map_category)
-        return health[health["Category"] != "Other"]
+        return get_data_reloader().current().copy(deep=False)
     except Exception as e:
         st.error(f"Error loading data: {str(e)}")
         return pd.DataFrame()
@@ -27,14 +64,12 @@ def apply_filters(data, filters):
     if not filters or data.empty:
         return data
     
-    filtered = data[
-        data['Year'].between(filters['year_range'][0], filters['year_range'][1])
-    ]
-    
-    if filters.get('categories'):
-        filtered = filtered[filtered['Category'].isin(filters['categories'])]
-    
-    return filtered.sort_values("Year")
+    return get_filter_engine(data).select(
+        year_range=filters['year_range'],
+        categories=filters.get('categories'),
+        keywords=filters.get('keywords'),
+        sort_order=filters.get('sort_order', "Ascending")
+    )
 
 def footer():
     st.markdown("""
@@ -70,23 +105,28 @@ def main():
     if any(page.startswith(cat) for cat in categories.keys()):
         set_section_background(page)
     
-    filtered_data = apply_filters(health_data, filters)
+    if any(page.startswith(cat) for cat in categories.keys()):
+        # A category page is already scoped to its own category
+        filtered_data = apply_filters(health_data, {**filters, 'categories': [page.replace(" Analysis", "")]})
+    else:
+        filtered_data = apply_filters(health_data, filters)
 
     if page == "About":
         show_about()
     elif page == "Overview":
         show_overview(health_data)
     elif page == "Executive Summary": 
-        show_summary() 
+        show_summary(health_data)
     elif page == "Comparative Insights":
-        show_comparative_section(health_data)
+        show_comparative_section(health_data, filtered_data)
     elif any(page.startswith(cat) for cat in categories.keys()):
         category_name = page.replace(" Analysis", "")
-        show_category_analysis(health_data, category_name)
+        show_category_analysis(health_data, category_name, filtered_data)
     else:
         st.error(f"Page '{page}' not configured")
     
     footer()
+    rerun_for_pending()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
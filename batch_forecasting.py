@@ -0,0 +1,153 @@
+from collections import namedtuple
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+from data_store import versioned_cache
+from health_matrix import get_health_matrix
+
+BATCH_MODELS = ("linear", "holt", "drift")
+# Smoothing, trend and damping parameters of the batch Holt model
+HOLT_PARAMS = (0.5, 0.3, 0.9)
+
+BatchForecast = namedtuple("BatchForecast", ["years", "indicators", "model", "point", "lower", "upper"])
+
+def _observed_bounds(present, years):
+    """
+    Returns each column's observation count and first and last observed rows.
+    """
+    counts = present.sum(axis=0)
+    first = present.argmax(axis=0)
+    last = len(years) - 1 - present[::-1].argmax(axis=0)
+    return counts, first, last
+
+def _linear_batch(values, years, present, horizon_years):
+    counts, _, _ = _observed_bounds(present, years)
+    x = np.where(present, years[:, None].astype(float), 0.0)
+    y = np.where(present, values, 0.0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x_mean = x.sum(axis=0) / counts
+        y_mean = y.sum(axis=0) / counts
+        dx = np.where(present, x - x_mean, 0.0)
+        sxx = (dx ** 2).sum(axis=0)
+        slope = (dx * (y - y_mean)).sum(axis=0) / sxx
+        intercept = y_mean - slope * x_mean
+        residuals = np.where(present, y - (intercept + slope * x), 0.0)
+        sigma = np.sqrt((residuals ** 2).sum(axis=0) / (counts - 2))
+        point = intercept + slope * horizon_years[:, None]
+        spread = sigma * np.sqrt(1 + 1 / counts + (horizon_years[:, None] - x_mean) ** 2 / sxx)
+    return point, spread
+
+def _drift_batch(values, years, present, horizon_years):
+    counts, first, last = _observed_bounds(present, years)
+    columns = np.arange(values.shape[1])
+    span = (years[last] - years[first]).astype(float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        drift = (values[last, columns] - values[first, columns]) / span
+
+        # Per-year changes between consecutive observations, gaps included
+        rows = np.where(present, np.arange(len(years))[:, None], -1)
+        previous = np.maximum.accumulate(rows, axis=0)[:-1]
+        has_previous = present[1:] & (previous >= 0)
+        previous = np.where(previous >= 0, previous, 0)
+        gaps = (years[1:, None] - years[previous]).astype(float)
+        changes = (values[1:] - values[previous, columns]) / gaps
+        errors = np.where(has_previous, changes - drift, 0.0)
+        sigma = np.sqrt((errors ** 2).sum(axis=0) / (has_previous.sum(axis=0) - 1))
+
+        steps = horizon_years[:, None] - years[last]
+        point = values[last, columns] + drift * steps
+        spread = sigma * np.sqrt(steps * (1 + steps / span))
+    return point, spread
+
+def _holt_batch(values, years, present, horizon_years, params=HOLT_PARAMS):
+    alpha, beta, phi = params
+    counts, first, last = _observed_bounds(present, years)
+    columns = np.arange(values.shape[1])
+    level = values[first, columns].copy()
+    trend = np.zeros(values.shape[1])
+    squared_errors = np.zeros(values.shape[1])
+    error_counts = np.zeros(values.shape[1])
+
+    # One pass over the years updates every indicator at once; missing
+    # years (and years before an indicator starts) just project the state
+    for row in range(len(years)):
+        started = row > first
+        predicted = level + phi * trend
+        observed = present[row] & started
+        error = np.where(observed, values[row] - predicted, 0.0)
+        new_level = np.where(observed, predicted + alpha * error, predicted)
+        new_trend = np.where(observed, phi * trend + alpha * beta * error, phi * trend)
+        level = np.where(started, new_level, level)
+        trend = np.where(started, new_trend, trend)
+        squared_errors += error ** 2
+        error_counts += observed
+
+    steps = horizon_years - years[-1]
+    damping = np.cumsum(phi ** np.arange(1, steps.max() + 1))[steps - 1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sigma = np.sqrt(squared_errors / error_counts)
+        point = level + damping[:, None] * trend
+        # Horizon measured from each indicator's last observation
+        spread = sigma * np.sqrt(horizon_years[:, None] - years[last])
+    return point, spread
+
+def batch_forecast(matrix, model="linear", steps=5, level=0.95):
+    """
+    Forecasts every indicator of a matrix at once.
+
+    Each model is fitted column-wise with NumPy over the whole year x
+    indicator array, skipping missing years. Indicators with fewer than
+    two observations (three for intervals) get NaN.
+
+    Args:
+        matrix (HealthMatrix): Indicators to forecast
+        model (str): "linear" (least-squares trend), "holt" (damped Holt
+            smoothing with HOLT_PARAMS) or "drift" (last value plus the
+            average yearly change)
+        steps (int): Years to forecast after the matrix's last year
+        level (float): Coverage of the prediction intervals
+
+    Returns:
+        BatchForecast: Forecast years, indicators, model, and point, lower and
+            upper arrays of shape (steps, n_indicators)
+    """
+    if model not in BATCH_MODELS:
+        raise ValueError(f"Unknown forecast model '{model}', expected one of {BATCH_MODELS}")
+    if matrix.empty:
+        empty = np.empty((steps, 0))
+        return BatchForecast(np.array([]), matrix.indicators, model, empty, empty, empty)
+
+    values = matrix.values
+    years = matrix.years.astype(int)
+    present = ~np.isnan(values)
+    horizon_years = np.arange(years[-1] + 1, years[-1] + 1 + steps)
+    fit = {"linear": _linear_batch, "holt": _holt_batch, "drift": _drift_batch}[model]
+    point, spread = fit(values, years, present, horizon_years)
+
+    too_short = present.sum(axis=0) < 2
+    point[:, too_short] = np.nan
+    z = NormalDist().inv_cdf(0.5 + level / 2)
+    return BatchForecast(horizon_years, matrix.indicators, model, point, point - z * spread, point + z * spread)
+
+def batch_forecast_frame(forecast):
+    """
+    Returns a BatchForecast as a long frame with Indicator Name, Year,
+    Forecast, Lower and Upper columns.
+    """
+    n_years, n_indicators = forecast.point.shape
+    return pd.DataFrame({
+        'Indicator Name': np.tile(np.asarray(forecast.indicators, dtype=object), n_years),
+        'Year': np.repeat(forecast.years, n_indicators),
+        'Forecast': forecast.point.ravel(),
+        'Lower': forecast.lower.ravel(),
+        'Upper': forecast.upper.ravel()
+    })
+
+@versioned_cache(max_entries=16)
+def get_batch_forecast(data, model="linear", steps=5):
+    """
+    Returns the batch forecast of every indicator in the full dataset, computed
+    once per model, horizon and data version.
+    """
+    return batch_forecast(get_health_matrix(data), model, steps)
@@ -1,3 +1,8 @@
+import hashlib
+import json
+
+import pandas as pd
+
 categories = {
   "Mortality Rates": [
     "Birth rate, crude (per 1,000 people)",
@@ -315,6 +320,72 @@ category_definitions = {
     "Injury and External Causes": "Data on injuries, accidents, and external causes of morbidity and mortality."
 }
 
+OTHER_CATEGORY = "Other"
+
+class CategoryIndex:
+    """
+    Reverse index over the category lists, built once at import time.
+
+    Attributes:
+        name_to_category (dict): Indicator name -> category
+        category_indicators (dict): Category -> frozenset of indicator names
+        category_codes (dict): Category -> integer code, with "Other" last
+        dtype (pd.CategoricalDtype): Category dtype of columns with only
+            mapped indicators
+        other_dtype (pd.CategoricalDtype): dtype with "Other" appended, used
+            only when a column actually holds "Other"
+        digest (str): Content hash of the category lists, so stored mappings
+            can tell when they are out of date
+    """
+
+    def __init__(self, category_lists):
+        self.name_to_category = {}
+        for category, indicators in category_lists.items():
+            for indicator in indicators:
+                self.name_to_category.setdefault(indicator, category)
+        self.category_indicators = {
+            category: frozenset(indicators) for category, indicators in category_lists.items()
+        }
+        names = list(category_lists.keys()) + [OTHER_CATEGORY]
+        self.category_codes = {category: code for code, category in enumerate(names)}
+        self.dtype = pd.CategoricalDtype(names[:-1])
+        self.other_dtype = pd.CategoricalDtype(names)
+        self.digest = hashlib.sha256(json.dumps(category_lists).encode("utf-8")).hexdigest()
+
+    def category_of(self, indicator_name):
+        """
+        Returns the category for a single indicator name, or "Other".
+        """
+        return self.name_to_category.get(indicator_name, OTHER_CATEGORY)
+
+    def indicators_in(self, category_name):
+        """
+        Returns the set of indicator names defined for a category.
+        """
+        return self.category_indicators.get(category_name, frozenset())
+
+    def map_categories(self, names):
+        """
+        Maps a Series of indicator names to categories in one vectorized pass.
+
+        Args:
+            names (pd.Series): Indicator names
+
+        Returns:
+            pd.Series: Categorical series of categories, "Other" when unmapped
+        """
+        return self.categorize(names.map(self.name_to_category).fillna(OTHER_CATEGORY))
+
+    def categorize(self, category_names):
+        """
+        Converts a Series of category names to the category dtype, which
+        only includes "Other" when some value is "Other".
+        """
+        has_other = (category_names == OTHER_CATEGORY).any()
+        return category_names.astype(self.other_dtype if has_other else self.dtype)
+
+category_index = CategoryIndex(categories)
+
 def map_category(indicator_name):
     """
     Maps health indicators to their respective categories based on predefined lists.
@@ -325,10 +396,7 @@ def map_category(indicator_name):
     Returns:
         str: The category the indicator belongs to
     """
-    for category, indicators in categories.items():
-        if indicator_name in indicators:
-            return category
-    return "Other"
+    return category_index.category_of(indicator_name)
 
 def get_category_definition(category_name):
     """
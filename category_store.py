@@ -0,0 +1,55 @@
+from collections import namedtuple
+
+from categories import categories
+from data_store import versioned_cache
+from health_matrix import get_health_matrix
+
+CategoryPartition = namedtuple("CategoryPartition", ["data", "matrix"])
+
+def build_category_partitions(health, matrix):
+    """
+    Splits the statistics table into one small partition per category.
+
+    Args:
+        health (pd.DataFrame): The frame returned by load_data
+        matrix (HealthMatrix): The matrix for the same frame
+
+    Returns:
+        dict: Category name -> CategoryPartition, with rows sorted by
+            indicator and year, for every category that has data
+    """
+    partitions = {}
+    if health.empty:
+        return partitions
+
+    ordered = health.sort_values(['Category', 'Indicator Name', 'Year'], kind='stable')
+    for category, rows in ordered.groupby('Category', observed=True, sort=False):
+        data = rows.reset_index(drop=True)
+        # Derived caches are keyed on data_version, which only describes the full table
+        data.attrs = {'source_version': health.attrs.get('data_version'), 'category': str(category)}
+        indicators = [name for name in data['Indicator Name'].unique() if name in matrix.indicator_index]
+        partitions[str(category)] = CategoryPartition(data, matrix.slice(indicators=indicators))
+    return partitions
+
+@versioned_cache()
+def get_category_partitions(data):
+    """
+    Returns the per-category partitions of the full dataset, built once per data version.
+
+    Args:
+        data (pd.DataFrame): The frame returned by load_data
+
+    Returns:
+        dict: Category name -> CategoryPartition
+    """
+    return build_category_partitions(data, get_health_matrix(data))
+
+def get_category_partition(data, category_name):
+    """
+    Returns the partition for one category (with or without the " Analysis"
+    page suffix), or None when the category has no data.
+    """
+    category = category_name.replace(" Analysis", "")
+    if category not in categories:
+        return None
+    return get_category_partitions(data).get(category)
@@ -0,0 +1,165 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+from data_store import versioned_cache
+from health_matrix import get_health_matrix
+
+def pairwise_correlation(values):
+    """
+    Computes pairwise-complete Pearson correlations between the columns of a
+    2-D array with NaN gaps, as pandas' DataFrame.corr does, with matrix
+    products instead of a loop over pairs.
+
+    Columns are standardized first so the moment sums stay well conditioned
+    for indicators measured in millions.
+
+    Args:
+        values (np.ndarray): Array of shape (n_years, n_indicators)
+
+    Returns:
+        tuple: (correlations as float32, overlap counts as uint16), both of
+            shape (n_indicators, n_indicators); NaN where fewer than two
+            years overlap or a series is constant over the overlap
+    """
+    present = ~np.isnan(values)
+    mask = present.astype(float)
+    with np.errstate(divide='ignore', invalid='ignore'), warnings.catch_warnings():
+        # Indicators with no values in the selected years are all-NaN columns
+        warnings.simplefilter("ignore", RuntimeWarning)
+        centered = values - np.nanmean(values, axis=0)
+        scale = np.nanstd(centered, axis=0)
+        scaled = np.where(present, centered / np.where(scale > 0, scale, 1.0), 0.0)
+
+        counts = mask.T @ mask
+        sums = scaled.T @ mask              # sums[i, j]: sum of i over years where j is present
+        squares = (scaled ** 2).T @ mask
+        products = scaled.T @ scaled
+
+        covariance = counts * products - sums * sums.T
+        variance = counts * squares - sums ** 2
+        # Series constant over an overlap leave rounding noise instead of zero
+        variance[variance <= 1e-10 * counts ** 2] = 0.0
+        correlation = covariance / np.sqrt(variance * variance.T)
+
+    correlation[(counts < 2) | ~np.isfinite(correlation)] = np.nan
+    np.clip(correlation, -1.0, 1.0, out=correlation)
+    np.fill_diagonal(correlation, np.where(np.isfinite(np.diag(correlation)), 1.0, np.nan))
+    return correlation.astype(np.float32), counts.astype(np.uint16)
+
+class CorrelationMatrix:
+    """
+    Indicator x indicator correlations with the number of overlapping years
+    behind each one.
+
+    Args:
+        indicators (pd.Index): Indicator names, one per row and column
+        correlation (np.ndarray): Pairwise-complete correlations
+        counts (np.ndarray): Overlapping years per pair
+    """
+
+    def __init__(self, indicators, correlation, counts):
+        self.indicators = pd.Index(indicators, name='Indicator Name')
+        self.correlation = correlation
+        self.counts = counts
+        self.indicator_index = {name: i for i, name in enumerate(self.indicators)}
+
+    @classmethod
+    def from_matrix(cls, matrix):
+        """
+        Computes the correlations of every indicator in a HealthMatrix.
+        """
+        if matrix.empty:
+            return cls(matrix.indicators, np.empty((0, 0), dtype=np.float32), np.empty((0, 0), dtype=np.uint16))
+        correlation, counts = pairwise_correlation(matrix.values)
+        return cls(matrix.indicators, correlation, counts)
+
+    def _positions(self, indicators):
+        if indicators is None:
+            return np.arange(len(self.indicators))
+        return np.asarray([self.indicator_index[name] for name in indicators], dtype=int)
+
+    def subset(self, indicators):
+        """
+        Returns a CorrelationMatrix restricted to some indicators.
+        """
+        positions = self._positions(indicators)
+        block = np.ix_(positions, positions)
+        return CorrelationMatrix(self.indicators[positions], self.correlation[block], self.counts[block])
+
+    def submatrix(self, indicators=None):
+        """
+        Returns the correlations between some indicators.
+
+        Returns:
+            tuple: (correlations, overlap counts) as DataFrames labelled by indicator
+        """
+        positions = self._positions(indicators)
+        labels = self.indicators[positions]
+        block = np.ix_(positions, positions)
+        return (
+            pd.DataFrame(self.correlation[block].astype(float), index=labels, columns=labels),
+            pd.DataFrame(self.counts[block].astype(int), index=labels, columns=labels)
+        )
+
+    def top_pairs(self, k=10, indicators=None, min_overlap=2):
+        """
+        Returns the k most strongly correlated (by absolute value) pairs.
+
+        Args:
+            k (int): Number of pairs
+            indicators (list): Restrict to pairs among these; None uses all
+            min_overlap (int): Minimum number of overlapping years
+
+        Returns:
+            pd.DataFrame: Indicator 1, Indicator 2, Correlation and Overlap
+                columns, strongest first
+        """
+        positions = self._positions(indicators)
+        rows, cols = np.triu_indices(len(positions), k=1)
+        rows, cols = positions[rows], positions[cols]
+        values = self.correlation[rows, cols]
+        overlap = self.counts[rows, cols]
+        valid = np.nonzero(~np.isnan(values) & (overlap >= min_overlap))[0]
+
+        strength = -np.abs(values[valid])
+        if len(valid) > k:
+            # Partition first so only the k candidates get fully sorted
+            candidates = np.argpartition(strength, k)[:k]
+            valid, strength = valid[candidates], strength[candidates]
+        best = valid[np.argsort(strength, kind='stable')][:k]
+
+        return pd.DataFrame({
+            'Indicator 1': self.indicators[rows[best]],
+            'Indicator 2': self.indicators[cols[best]],
+            'Correlation': values[best].astype(float),
+            'Overlap': overlap[best].astype(int)
+        })
+
+@versioned_cache()
+def get_correlation_matrix(data):
+    """
+    Returns the CorrelationMatrix of every indicator in the full dataset,
+    computed once per data version.
+    """
+    return CorrelationMatrix.from_matrix(get_health_matrix(data))
+
+def get_correlations(data, indicators, year_range=None):
+    """
+    Returns the CorrelationMatrix for a selection of indicators and years.
+
+    Selections spanning every year are looked up in the cached full matrix;
+    narrower year ranges are computed for the selected indicators only.
+
+    Args:
+        data (pd.DataFrame): The frame returned by load_data
+        indicators (list): Selected indicator names
+        year_range (tuple): Inclusive (start, end) years; None keeps all years
+
+    Returns:
+        CorrelationMatrix: Correlations of the selected indicators
+    """
+    matrix = get_health_matrix(data)
+    if year_range is None or (year_range[0] <= matrix.years[0] and year_range[1] >= matrix.years[-1]):
+        return get_correlation_matrix(data).subset(indicators)
+    return CorrelationMatrix.from_matrix(matrix.slice(years=year_range, indicators=indicators))
@@ -1,15 +1,26 @@
+import html
+from collections import namedtuple
+
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
-from categories import categories
+from categories import categories, category_index
 from sidebar import SECTION_BACKGROUNDS, set_section_background
+from category_store import get_category_partition
+from animation import get_category_trend_frames, trend_traces, payload_caption
+from kpi import get_kpis
+from figure_cache import show_figure
+from tables import show_paged_table
+from images import image_url
+from data_store import versioned_cache
 
 background_images = {
-    "About": "https://raw.githubusercontent.com/iffathsaleem/DSPL_ICW/main/Images/About.jpg",
-    "Overview": "https://raw.githubusercontent.com/iffathsaleem/DSPL_ICW/main/Images/Overview.jpg",
-    "Comparative Insights": "https://raw.githubusercontent.com/iffathsaleem/DSPL_ICW/main/Images/Comparative%20Insights.jpg",
-    "Executive Summary": "https://raw.githubusercontent.com/iffathsaleem/DSPL_ICW/main/Images/Key%20Indicator%20Highlights.jpg",
+    "About": "About.jpg",
+    "Overview": "Overview.jpg",
+    "Comparative Insights": "Comparative Insights.jpg",
+    "Executive Summary": "Key Indicator Highlights.jpg",
     **SECTION_BACKGROUNDS
 }
 
@@ -24,11 +35,11 @@ def apply_custom_styling():
 
 def initialize_page(category):
     if category in background_images:
-        background_url = background_images[category]
+        background_url = image_url(background_images[category])
         st.markdown(f"""
         <style>
         .stApp {{
-            background-image: linear-gradient(rgba(0,0,0,0.7), rgba(0,0,0,0.7)), url({background_url});
+            background-image: linear-gradient(rgba(0,0,0,0.7), rgba(0,0,0,0.7)), url('{background_url}');
             background-size: cover;
             background-position: center;
             background-repeat: no-repeat;
@@ -76,14 +87,72 @@ def initialize_page(category):
     """, unsafe_allow_html=True)
 
 def format_value(value, is_percentage=False):
+    if isinstance(value, pd.Series):
+        return format_values(value, is_percentage)
     if pd.isna(value):
         return "N/A"
-    if is_percentage or (isinstance(value, (int, float)) and 0 <= value <= 100):
+    if is_percentage or (isinstance(value, (int, float, np.number)) and 0 <= value <= 100):
         return f"{value:.2f}%"
-    if isinstance(value, (int, float)) and float(value).is_integer():
+    if isinstance(value, (int, float, np.number)) and float(value).is_integer():
         return f"{int(value):,}"
     return f"{value:,.2f}"
 
+def format_values(values, is_percentage=False):
+    """
+    Formats a Series of values with the format_value rules, one mask per rule.
+
+    Args:
+        values (pd.Series): Numeric values
+        is_percentage (bool or pd.Series): Whether values are percentages
+
+    Returns:
+        pd.Series: Formatted strings with the same index
+    """
+    values = pd.to_numeric(values, errors='coerce').astype(float)
+    missing = values.isna()
+    percent = ~missing & (((values >= 0) & (values <= 100)) | is_percentage)
+    integer = ~missing & ~percent & (values % 1 == 0)
+    other = ~missing & ~percent & ~integer
+
+    formatted = pd.Series("N/A", index=values.index, dtype=object)
+    formatted[percent] = values[percent].map("{:.2f}%".format)
+    formatted[integer] = values[integer].astype('int64').map("{:,}".format)
+    formatted[other] = values[other].map("{:,.2f}".format)
+    return formatted
+
+def latest_value_cards(data):
+    """
+    Renders the latest year's value of every indicator in a category as one
+    HTML grid of cards.
+
+    Args:
+        data (pd.DataFrame): Rows of a single category
+
+    Returns:
+        str: The card grid HTML, or an empty string when there is no data
+    """
+    if data.empty:
+        return ""
+    latest_year = data['Year'].max()
+    latest_data = data.loc[data['Year'].to_numpy() == latest_year, ['Indicator Name', 'Value']]
+    if latest_data.empty:
+        return ""
+
+    names = latest_data['Indicator Name'].astype(str).map(html.escape)
+    values = format_values(latest_data['Value'])
+    cards = (
+        '<div style="background-color: rgba(0,0,0,0.7); padding: 15px; border-radius: 8px;">'
+        '<p style="margin: 0 0 8px 0; font-size: 14px;">' + names + '</p>'
+        '<h3 style="margin: 0; color: #81D4FA;">' + values + '</h3>'
+        f'<p style="margin: 8px 0 0 0; font-size: 12px; opacity: 0.8;">Year: {latest_year}</p>'
+        '</div>'
+    )
+    return (
+        '<div style="display: grid; grid-template-columns: repeat(3, minmax(0, 1fr)); gap: 15px;">'
+        + "".join(cards) +
+        '</div>'
+    )
+
 def show_overview(health_data):
     # Ensure we're using the right background with proper overlay
     initialize_page("Overview")
@@ -110,47 +179,50 @@ def show_overview(health_data):
     <hr style="height:2px;border:none;color:#cccccc;background-color:#cccccc;margin-bottom:30px;margin-top:30px;" />
     """, unsafe_allow_html=True)
     
-    latest_year = health_data['Year'].max()
-    year_range = f"{health_data['Year'].min()} to {health_data['Year'].max()}"
-    coverage_pct = len(health_data[health_data['Year'] == latest_year]) / len(health_data) * 100
+    kpis = get_kpis(health_data)
+    if kpis is None:
+        st.warning("No data available")
+        return
     
     cols = st.columns(3)
     with cols[0]:
-        st.metric("Total Indicators", health_data['Indicator Name'].nunique())
+        st.metric("Total Indicators", kpis.total_indicators)
     with cols[1]:
-        st.metric("Years Covered", year_range)
+        st.metric("Years Covered", f"{kpis.first_year} to {kpis.latest_year}")
     with cols[2]:
-        st.metric(f"{latest_year} Data Coverage", f"{coverage_pct:.1f}%")
+        st.metric(f"{kpis.latest_year} Data Coverage", f"{kpis.coverage_pct:.1f}%")
     
     st.markdown("""
     <hr style="height:2px;border:none;color:#cccccc;background-color:#cccccc;margin-bottom:30px;margin-top:30px;" />
     """, unsafe_allow_html=True)
     st.subheader("Data Composition")
     
-    category_counts = health_data.groupby('Category').size().reset_index(name='Count')
-    fig = px.pie(
-        category_counts, 
-        names='Category', 
-        values='Count', 
-        hole=0.3, 
-        color_discrete_sequence=px.colors.qualitative.Pastel
-    )
-    fig.update_traces(textposition='inside', textinfo='percent+label')
-    fig.update_layout(
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        margin=dict(t=40, b=40, l=20, r=20),
-        font=dict(color='white'),
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=-0.2,
-            xanchor="center",
-            x=0.5,
-            font=dict(size=11)
+    def build_composition_chart():
+        fig = px.pie(
+            kpis.category_counts, 
+            names='Category', 
+            values='Count', 
+            hole=0.3, 
+            color_discrete_sequence=px.colors.qualitative.Pastel
         )
-    )
-    st.plotly_chart(fig, use_container_width=True)
+        fig.update_traces(textposition='inside', textinfo='percent+label')
+        fig.update_layout(
+            plot_bgcolor='rgba(0,0,0,0)',
+            paper_bgcolor='rgba(0,0,0,0)',
+            margin=dict(t=40, b=40, l=20, r=20),
+            font=dict(color='white'),
+            legend=dict(
+                orientation="h",
+                yanchor="bottom",
+                y=-0.2,
+                xanchor="center",
+                x=0.5,
+                font=dict(size=11)
+            )
+        )
+        return fig
+
+    show_figure("overview_composition", health_data.attrs.get('data_version'), build_composition_chart)
     
     st.markdown("""
     <hr style="height:2px;border:none;color:#cccccc;background-color:#cccccc;margin-bottom:30px;margin-top:30px;" />
@@ -158,173 +230,189 @@ def show_overview(health_data):
 
     st.header("Performance Trends")
     
-    health_data['Value'] = pd.to_numeric(health_data['Value'], errors='coerce')
-    current_avg = health_data[health_data['Year'] == latest_year]['Value'].mean()
-    past_avg = health_data[health_data['Year'] == latest_year-10]['Value'].mean()
-    avg_change = ((current_avg - past_avg) / past_avg * 100) if past_avg != 0 else 0
-    
     cols = st.columns(3)
     with cols[0]:
-        st.metric("Average Value", f"{current_avg:.1f}", f"{avg_change:.1f}% vs 10y ago")
+        st.metric("Average Value", f"{kpis.current_avg:.1f}", f"{kpis.avg_change:.1f}% vs 10y ago")
     with cols[1]:
-        complete_series = health_data.groupby('Indicator Name')['Year'].nunique().max()
-        st.metric("Most Complete Series", f"{complete_series} years")
+        st.metric("Most Complete Series", f"{kpis.complete_series} years")
     
     st.markdown("""
     <hr style="height:2px;border:none;color:#cccccc;background-color:#cccccc;margin-bottom:30px;margin-top:30px;" />
     """, unsafe_allow_html=True)
 
     st.header("Animated Category Trends (1960-2023)")
-    tabs = st.tabs(list(categories.keys()))
-    
-    for tab, (category, indicators) in zip(tabs, categories.items()):
-        with tab:
-            category_data = health_data[
-                (health_data['Indicator Name'].isin(indicators)) &
-                (health_data['Value'].notna())
-            ].copy()
-            
-            category_data = category_data[(category_data['Year'] >= 1960) & (category_data['Year'] <= 2023)]
-            
-            if not category_data.empty:
-                available_indicators = category_data[['Indicator Name', 'Indicator_Code']].drop_duplicates()
-                st.write(f"Showing {len(available_indicators)} of {len(indicators)} indicators for {category}")
-                
-                fig = go.Figure()
-                
-                colors = px.colors.qualitative.Plotly
-                for i, row in available_indicators.iterrows():
-                    indicator_name = row['Indicator Name']
-                    indicator_code = row['Indicator_Code']
-                    indicator_data = category_data[category_data['Indicator Name'] == indicator_name]
-                    
-                    fig.add_trace(go.Scatter(
-                        x=indicator_data['Year'],
-                        y=indicator_data['Value'],
-                        name=indicator_code,
-                        mode='lines+markers',
-                        marker=dict(size=10),
-                        line=dict(width=4),
-                        marker_color=colors[i % len(colors)],
-                        hovertemplate=f"{indicator_name}<br>Year: %{{x}}<br>Value: %{{y}}",
-                        customdata=[indicator_name] * len(indicator_data)
-                    ))
-                
-                fig.update_layout(
-                    height=1100,
-                    width=1200,
-                    template='plotly_dark',
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    margin=dict(l=100, r=100, t=100, b=350),
-                    xaxis=dict(
-                        title='Year',
-                        showline=True,
-                        showgrid=False,
-                        range=[1960, 2023],
-                        tickmode='linear',
-                        tick0=1960,
-                        dtick=10,
-                        tickfont=dict(size=14),
-                        title_font=dict(size=16),
-                        ticklen=10,
-                        tickwidth=2,
-                        ticks='outside'
-                    ),
-                    yaxis=dict(
-                        title='Value',
-                        showgrid=True,
-                        gridcolor='rgba(100, 100, 100, 0.3)',
-                        tickfont=dict(size=14),
-                        title_font=dict(size=16)
-                    ),
-                    legend=dict(
-                        orientation="h",
-                        yanchor="top",
-                        y=-0.35,
-                        xanchor="center",
-                        x=0.5,
-                        font=dict(size=12),
-                        itemwidth=40,
-                        bgcolor='rgba(0,0,0,0.5)'
-                    ),
-                    updatemenus=[dict(
-                        type="buttons",
-                        showactive=True,
-                        buttons=[
-                            dict(label="PLAY", method="animate", args=[None]),
-                            dict(label="PAUSE", method="animate", args=[[None], {"frame": {"duration": 0}}])
-                        ],
-                        x=0.1,
-                        xanchor="right",
-                        y=-0.5,
-                        yanchor="top",
-                        pad=dict(t=20, b=20),
-                        bgcolor='rgba(0,0,0,0.7)'
-                    )],
-                    sliders=[dict(
-                        currentvalue={"prefix": "YEAR: ", "font": {"size": 14}},
-                        pad=dict(t=120, b=50),
-                        steps=[
-                            dict(
-                                args=[[str(year)], dict(mode="immediate")], 
-                                label=str(year), 
-                                method="animate"
-                            ) 
-                            for year in range(1960, 2024)
-                        ]
-                    )]
-                )
-                
-                frames = []
-                for year in range(1960, 2024):
-                    frame_data = []
-                    for i, row in available_indicators.iterrows():
-                        year_data = category_data[
-                            (category_data['Year'] <= year) & 
-                            (category_data['Indicator Name'] == row['Indicator Name'])
-                        ]
-                        frame_data.append(
-                            go.Scatter(
-                                x=year_data['Year'],
-                                y=year_data['Value']
-                            )
-                        )
-                    frames.append(go.Frame(data=frame_data, name=str(year)))
-                fig.frames = frames
-                
-                st.plotly_chart(fig, use_container_width=True)
-                
-                st.markdown("""
-                <hr style="height:2px;border:none;color:#cccccc;background-color:#cccccc;margin-bottom:30px;margin-top:30px;" />
-                """, unsafe_allow_html=True)
-                
-                with st.expander("Indicator Code Reference", expanded=False):
-                    mapping_table = available_indicators[['Indicator_Code', 'Indicator Name']] \
-                        .rename(columns={'Indicator_Code': 'Indicator Code'}) \
-                        .sort_values('Indicator Code') \
-                        .reset_index(drop=True)
-                    
-                    st.dataframe(
-                        mapping_table.style.apply(
-                            lambda x: ['background: #222222' if i%2==0 else 'background: #444444' 
-                                     for i in range(len(x))],
-                            axis=1
-                        ),
-                        use_container_width=True,
-                        height=min(400, 35 * len(mapping_table) + 38)
-                    )
-                
-                st.subheader("Raw Data")
-                st.dataframe(
-                    category_data[['Indicator_Code', 'Indicator Name', 'Year', 'Value']]
-                    .rename(columns={'Indicator_Code': 'Indicator Code'})
-                    .sort_values(['Indicator Code', 'Year'])
-                    .reset_index(drop=True),
-                    use_container_width=True
-                )
-
-def show_category_analysis(data, category_name):
+    # Only the selected category is built and sent to the browser
+    category = st.radio(
+        "Category",
+        list(categories.keys()),
+        horizontal=True,
+        key="overview_category",
+        label_visibility="collapsed"
+    )
+    show_overview_tab(health_data, category)
+
+OverviewTab = namedtuple("OverviewTab", ["mapping_table", "raw_table", "caption", "shown", "total"])
+
+def build_overview_tab(health_data, category):
+    """
+    Builds the tables and captions of one Overview category.
+
+    Returns:
+        OverviewTab: The indicator code mapping, raw rows, payload caption
+            (None unless debugging animations) and indicator counts; None
+            when the category has no data
+    """
+    trend_frames = get_category_trend_frames(health_data, category, (1960, 2023))
+    if trend_frames is None or not trend_frames.indicators:
+        return None
+
+    category_data = get_category_partition(health_data, category).data
+    category_data = category_data[
+        category_data['Value'].notna() & category_data['Year'].between(1960, 2023)
+    ]
+    available_indicators = pd.DataFrame({
+        'Indicator Name': trend_frames.indicators,
+        'Indicator_Code': trend_frames.codes
+    })
+
+    mapping_table = available_indicators[['Indicator_Code', 'Indicator Name']] \
+        .rename(columns={'Indicator_Code': 'Indicator Code'}) \
+        .sort_values('Indicator Code') \
+        .reset_index(drop=True)
+    raw_table = category_data[['Indicator_Code', 'Indicator Name', 'Year', 'Value']] \
+        .rename(columns={'Indicator_Code': 'Indicator Code'}) \
+        .sort_values(['Indicator Code', 'Year']) \
+        .reset_index(drop=True)
+
+    return OverviewTab(
+        mapping_table,
+        raw_table,
+        payload_caption(health_data, category, (1960, 2023)),
+        len(available_indicators),
+        len(categories[category])
+    )
+
+def build_overview_figure(health_data, category):
+    """
+    Builds the animated 1960-2023 trend chart of one Overview category.
+    """
+    trend_frames = get_category_trend_frames(health_data, category, (1960, 2023))
+    fig = go.Figure(data=trend_traces(trend_frames))
+
+    fig.update_layout(
+        height=1100,
+        width=1200,
+        template='plotly_dark',
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        margin=dict(l=100, r=100, t=100, b=350),
+        xaxis=dict(
+            title='Year',
+            showline=True,
+            showgrid=False,
+            range=[1960, 2023],
+            tickmode='linear',
+            tick0=1960,
+            dtick=10,
+            tickfont=dict(size=14),
+            title_font=dict(size=16),
+            ticklen=10,
+            tickwidth=2,
+            ticks='outside'
+        ),
+        yaxis=dict(
+            title='Value',
+            showgrid=True,
+            gridcolor='rgba(100, 100, 100, 0.3)',
+            tickfont=dict(size=14),
+            title_font=dict(size=16)
+        ),
+        legend=dict(
+            orientation="h",
+            yanchor="top",
+            y=-0.35,
+            xanchor="center",
+            x=0.5,
+            font=dict(size=12),
+            itemwidth=40,
+            bgcolor='rgba(0,0,0,0.5)'
+        ),
+        updatemenus=[dict(
+            type="buttons",
+            showactive=True,
+            buttons=[
+                dict(label="PLAY", method="animate", args=[None]),
+                dict(label="PAUSE", method="animate", args=[[None], {"frame": {"duration": 0}}])
+            ],
+            x=0.1,
+            xanchor="right",
+            y=-0.5,
+            yanchor="top",
+            pad=dict(t=20, b=20),
+            bgcolor='rgba(0,0,0,0.7)'
+        )],
+        sliders=[dict(
+            currentvalue={"prefix": "YEAR: ", "font": {"size": 14}},
+            pad=dict(t=120, b=50),
+            steps=[
+                dict(
+                    args=[[str(year)], dict(mode="immediate")], 
+                    label=str(year), 
+                    method="animate"
+                ) 
+                for year in trend_frames.years
+            ]
+        )]
+    )
+
+    fig.frames = trend_frames.frames
+    return fig
+
+@versioned_cache(max_entries=32)
+def get_overview_tab(health_data, category):
+    """
+    Returns the OverviewTab of a category, built once per category and data version.
+    Its tables are shared between sessions and must not be modified.
+    """
+    return build_overview_tab(health_data, category)
+
+def show_overview_tab(health_data, category):
+    tab = get_overview_tab(health_data, category)
+    if tab is None:
+        st.warning(f"No data available for {category}")
+        return
+
+    st.write(f"Showing {tab.shown} of {tab.total} indicators for {category}")
+    version = health_data.attrs.get('data_version')
+    show_figure(
+        "overview_trend",
+        None if version is None else (version, category),
+        lambda: build_overview_figure(health_data, category)
+    )
+    if tab.caption:
+        st.caption(tab.caption)
+
+    st.markdown("""
+    <hr style="height:2px;border:none;color:#cccccc;background-color:#cccccc;margin-bottom:30px;margin-top:30px;" />
+    """, unsafe_allow_html=True)
+
+    with st.expander("Indicator Code Reference", expanded=False):
+        show_paged_table(
+            tab.mapping_table,
+            "overview_codes",
+            None if version is None else ("overview_codes", version, category),
+            striped=True,
+            controls=False
+        )
+
+    st.subheader("Raw Data")
+    show_paged_table(
+        tab.raw_table,
+        "overview_raw",
+        None if version is None else ("overview_raw", version, category)
+    )
+
+def show_category_analysis(data, category_name, filtered_data=None):
     apply_custom_styling()
     initialize_page(category_name)
     
@@ -343,12 +431,11 @@ def show_category_analysis(data, category_name):
         "Injury and External Causes Analysis": "Analyzing accidents and violence."
     }
     
-    if data.empty:
+    partition = None if data.empty else get_category_partition(data, category_name)
+    if partition is None:
         st.warning(f"No data available for {category_name}")
         return
-    
-    # Convert data to numeric if not already
-    data['Value'] = pd.to_numeric(data['Value'], errors='coerce')
+    full_data, data = data, partition.data
     
     # Header and introduction
     st.title(category_name)
@@ -371,7 +458,7 @@ def show_category_analysis(data, category_name):
     
     # Animated chart section
     st.header("Trend Analysis")
-    show_animated_trend_chart(data, category_name)
+    show_animated_trend_chart(full_data, category_name)
     
     st.markdown("""
     
@@ -379,183 +466,139 @@ def show_category_analysis(data, category_name):
     
     # Latest values section
     st.header("Latest Values")
-    latest_year = data['Year'].max()
-    latest_data = data[data['Year'] == latest_year]
-    
-    if not latest_data.empty:
-        cols = st.columns(3)
-        for idx, row in latest_data.iterrows():
-            with cols[idx % 3]:
-                st.markdown(
-                    f"""
-                    
-                        
-{row['Indicator Name']}
-                        
-{format_value(row['Value'])}
-                        
-Year: {latest_year}
-                    
-                    """,
-                    unsafe_allow_html=True
-                )
+    # One element for the whole grid instead of one per indicator
+    cards = latest_value_cards(data)
+    if cards:
+        st.markdown(cards, unsafe_allow_html=True)
     
     st.markdown("""
     
     """, unsafe_allow_html=True)
     
-    # Complete dataset
+    # Complete dataset, narrowed by the sidebar filters when given
+    if filtered_data is None:
+        table_data, source = data, (full_data.attrs.get('data_version'), category_name)
+    else:
+        table_data, source = filtered_data, (filtered_data.attrs.get('source_version'), filtered_data.attrs.get('filters'))
     st.header("Dataset Relevant To Catergory")
-    st.dataframe(
-    data[data['Category'] == category_name.replace(" Analysis", "")][['Indicator_Code', 'Indicator Name', 'Year', 'Value', 'Category']]
-    .sort_values(['Indicator Name', 'Year'])
-    .reset_index(drop=True),
-    use_container_width=True,
-    height=500
-)
+    show_paged_table(
+        table_data[['Indicator_Code', 'Indicator Name', 'Year', 'Value', 'Category']],
+        "category_rows",
+        None if source[0] is None else ("category_rows",) + source
+    )
 
 def show_animated_trend_chart(data, category_name):
     if data.empty:
         st.warning(f"No data available for {category_name}")
         return
     
-    indicators = categories.get(category_name.replace(" Analysis", ""), [])
-    if not indicators:
+    category = category_name.replace(" Analysis", "")
+    if not category_index.indicators_in(category):
         st.warning("No indicators defined for this category")
         return
     
-    category_data = data[
-        (data['Indicator Name'].isin(indicators)) &
-        (data['Value'].notna())
-    ].copy()
-    
-    if category_data.empty:
+    trend_frames = get_category_trend_frames(data, category)
+    if trend_frames is None or not trend_frames.indicators:
         st.warning("No valid data points for visualization")
         return
     
-    available_indicators = category_data[['Indicator Name', 'Indicator_Code']].drop_duplicates()
-    
-    fig = go.Figure()
+    available_indicators = pd.DataFrame({
+        'Indicator Name': trend_frames.indicators,
+        'Indicator_Code': trend_frames.codes
+    })
+    years = trend_frames.years
+    version = data.attrs.get('data_version')
     
-    colors = px.colors.qualitative.Plotly
-    for i, row in available_indicators.iterrows():
-        indicator_name = row['Indicator Name']
-        indicator_code = row['Indicator_Code']
-        indicator_data = category_data[category_data['Indicator Name'] == indicator_name]
-        
-        fig.add_trace(go.Scatter(
-            x=indicator_data['Year'],
-            y=indicator_data['Value'],
-            name=indicator_code,
-            mode='lines+markers',
-            marker=dict(size=10),
-            line=dict(width=4),
-            marker_color=colors[i % len(colors)],
-            hovertemplate=f"{indicator_name}<br>Year: %{{x}}<br>Value: %{{y}}",
-            customdata=[indicator_name] * len(indicator_data))
+    def build_trend_chart():
+        fig = go.Figure(data=trend_traces(trend_frames))
+        fig.frames = trend_frames.frames
+
+        fig.update_layout(
+            height=800,
+            template='plotly_dark',
+            plot_bgcolor='rgba(0,0,0,0)',
+            paper_bgcolor='rgba(0,0,0,0)',
+            margin=dict(l=100, r=100, t=100, b=100),
+            xaxis=dict(
+                title='Year',
+                showline=True,
+                showgrid=False,
+                range=[years[0]-1, years[-1]+1],
+                tickmode='linear',
+                tick0=years[0],
+                dtick=5,
+                tickfont=dict(size=14),
+                title_font=dict(size=16),
+                ticklen=10,
+                tickwidth=2,
+                ticks='outside'
+            ),
+            yaxis=dict(
+                title='Value',
+                showgrid=True,
+                gridcolor='rgba(100, 100, 100, 0.3)',
+                tickfont=dict(size=14),
+                title_font=dict(size=16)
+            ),
+            legend=dict(
+                orientation="h",
+                yanchor="top",
+                y=-0.5,  
+                xanchor="center",
+                x=0.5,
+                font=dict(size=12),
+                itemwidth=40,
+                bgcolor='rgba(0,0,0,0.5)'
+            ),
+            updatemenus=[dict(
+                type="buttons",
+                showactive=True,
+                buttons=[
+                    dict(
+                        label="▶️ Play",
+                        method="animate",
+                        args=[None, {
+                            "frame": {"duration": 500, "redraw": True},
+                            "fromcurrent": True,
+                            "transition": {"duration": 300}
+                        }]
+                    ),
+                    dict(
+                        label="⏸ Pause",
+                        method="animate",
+                        args=[[None], {
+                            "frame": {"duration": 0, "redraw": False},
+                            "mode": "immediate",
+                            "transition": {"duration": 0}
+                        }]
+                    )
+                ],
+                x=0.1,
+                xanchor="right",
+                y=-0.3,
+                yanchor="top",
+                pad=dict(t=20, b=20),
+                bgcolor='rgba(0,0,0,0.7)'
+            )],
+            sliders=[dict(
+                active=0,
+                currentvalue={"prefix": "Year: ", "font": {"size": 14}},
+                pad=dict(t=50, b=20),
+                steps=[
+                    dict(
+                        args=[[str(year)], dict(mode="immediate", frame={"duration": 0})],
+                        label=str(year),
+                        method="animate"
+                    ) for year in years
+                ]
+            )]
         )
-    
-    years = sorted(category_data['Year'].unique())
-    frames = [go.Frame(
-        name=str(year),
-        data=[
-            go.Scatter(
-                x=category_data[
-                    (category_data['Indicator Name'] == row['Indicator Name']) &
-                    (category_data['Year'] <= year)
-                ]['Year'],
-                y=category_data[
-                    (category_data['Indicator Name'] == row['Indicator Name']) &
-                    (category_data['Year'] <= year)
-                ]['Value']
-            ) for i, row in available_indicators.iterrows()
-        ]
-    ) for year in years]
-    
-    fig.frames = frames
-    
-    fig.update_layout(
-        height=800,
-        template='plotly_dark',
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        margin=dict(l=100, r=100, t=100, b=100),
-        xaxis=dict(
-            title='Year',
-            showline=True,
-            showgrid=False,
-            range=[years[0]-1, years[-1]+1],
-            tickmode='linear',
-            tick0=years[0],
-            dtick=5,
-            tickfont=dict(size=14),
-            title_font=dict(size=16),
-            ticklen=10,
-            tickwidth=2,
-            ticks='outside'
-        ),
-        yaxis=dict(
-            title='Value',
-            showgrid=True,
-            gridcolor='rgba(100, 100, 100, 0.3)',
-            tickfont=dict(size=14),
-            title_font=dict(size=16)
-        ),
-        legend=dict(
-            orientation="h",
-            yanchor="top",
-            y=-0.5,  
-            xanchor="center",
-            x=0.5,
-            font=dict(size=12),
-            itemwidth=40,
-            bgcolor='rgba(0,0,0,0.5)'
-        ),
-        updatemenus=[dict(
-            type="buttons",
-            showactive=True,
-            buttons=[
-                dict(
-                    label="▶️ Play",
-                    method="animate",
-                    args=[None, {
-                        "frame": {"duration": 500, "redraw": True},
-                        "fromcurrent": True,
-                        "transition": {"duration": 300}
-                    }]
-                ),
-                dict(
-                    label="⏸ Pause",
-                    method="animate",
-                    args=[[None], {
-                        "frame": {"duration": 0, "redraw": False},
-                        "mode": "immediate",
-                        "transition": {"duration": 0}
-                    }]
-                )
-            ],
-            x=0.1,
-            xanchor="right",
-            y=-0.3,
-            yanchor="top",
-            pad=dict(t=20, b=20),
-            bgcolor='rgba(0,0,0,0.7)'
-        )],
-        sliders=[dict(
-            active=0,
-            currentvalue={"prefix": "Year: ", "font": {"size": 14}},
-            pad=dict(t=50, b=20),
-            steps=[
-                dict(
-                    args=[[str(year)], dict(mode="immediate", frame={"duration": 0})],
-                    label=str(year),
-                    method="animate"
-                ) for year in years
-            ]
-        )]
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
+        return fig
+
+    show_figure("category_trend", None if version is None else (version, category), build_trend_chart)
+    caption = payload_caption(data, category)
+    if caption:
+        st.caption(caption)
     
     with st.expander("Indicator Code Reference", expanded=False):
         mapping_table = available_indicators[['Indicator_Code', 'Indicator Name']] \
@@ -563,14 +606,12 @@ def show_animated_trend_chart(data, category_name):
             .sort_values('Indicator Code') \
             .reset_index(drop=True)
         
-        st.dataframe(
-            mapping_table.style.apply(
-                lambda x: ['background: #222222' if i%2==0 else 'background: #444444' 
-                         for i in range(len(x))],
-                axis=1
-            ),
-            use_container_width=True,
-            height=min(400, 35 * len(mapping_table) + 38)
+        show_paged_table(
+            mapping_table,
+            "category_codes",
+            None if version is None else ("category_codes", version, category),
+            striped=True,
+            controls=False
         )
 
 def show_demographic_insights(data):
@@ -0,0 +1,106 @@
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+class DatasetReloader:
+    """
+    Keeps a loaded dataset fresh by polling its source on a background thread.
+
+    When the source's modification time, size or inode changes and then stays
+    the same for one more poll, so a writer that is still copying the file is
+    not read half way, the dataset is reloaded and every warmer is run on it
+    off the request path. Only then is the new dataset swapped in with a single
+    reference assignment, so sessions keep reading the previous version until
+    the new one is fully built.
+
+    Args:
+        loader (callable): Returns the dataset; its attrs["data_version"] is
+            used to skip swaps when the contents did not actually change
+        path (str): File or directory to watch
+        interval (float): Seconds between polls; 0 disables the watcher
+        warmers (list): Callables run on a new dataset before it is swapped in,
+            e.g. get_health_matrix to pre-build derived structures; they run
+            on the polling thread, so they must not call Streamlit APIs
+    """
+
+    def __init__(self, loader, path, interval=5.0, warmers=()):
+        self.loader = loader
+        self.path = path
+        self.interval = interval
+        self.warmers = list(warmers)
+        self._stat = self._source_stat()
+        self._pending_stat = None
+        self._current = self._build()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _source_stat(self):
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def _build(self):
+        data = self.loader()
+        for warm in self.warmers:
+            warm(data)
+        return data
+
+    @property
+    def version(self):
+        return self._current.attrs.get("data_version")
+
+    def current(self):
+        """
+        Returns the most recent fully built dataset.
+        """
+        return self._current
+
+    def check(self):
+        """
+        Reloads the dataset if its source changed and has since been stable
+        for one poll.
+
+        Returns:
+            bool: Whether a new version was swapped in
+        """
+        stat = self._source_stat()
+        if stat is None or stat == self._stat:
+            self._pending_stat = None
+            return False
+        if stat != self._pending_stat:
+            # Still being written, or just finished: wait for the next poll
+            self._pending_stat = stat
+            return False
+        self._pending_stat = None
+        data = self._build()
+        self._stat = stat
+        if data.attrs.get("data_version") is not None and data.attrs.get("data_version") == self.version:
+            return False
+        self._current = data
+        logger.info("Reloaded dataset from %s (version %s)", self.path, self.version)
+        return True
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception:
+                # Keep serving the previous version; retry on the next poll
+                logger.exception("Reloading dataset from %s failed", self.path)
+
+    def start(self):
+        """
+        Starts the polling thread, unless it is disabled or already running.
+        """
+        if self.interval <= 0 or (self._thread is not None and self._thread.is_alive()):
+            return self
+        self._thread = threading.Thread(target=self._run, name="dataset-reloader", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
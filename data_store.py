@@ -0,0 +1,338 @@
+import functools
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+from categories import OTHER_CATEGORY, category_index
+
+DATA_PATH = "Sri Lanka Health Statistics.csv"
+SNAPSHOT_DIR = ".snapshot"
+SNAPSHOT_FORMAT_VERSION = 3
+
+def data_version(data):
+    """
+    Returns the content hash load_health_data stores on a frame, or None.
+    """
+    return data.attrs.get('data_version')
+
+def versioned_cache(max_entries=2, version=data_version):
+    """
+    Caches a function of a dataset in a process-wide LRU store, once per version.
+
+    The decorated function takes the dataset (a frame, or anything version
+    accepts) first, followed by hashable arguments. Results are shared
+    between sessions and keyed on the dataset's version plus the arguments;
+    datasets without a version are built uncached every time.
+
+    The store does not go through st.cache_resource, so the dataset reloader
+    can fill it from its own thread, outside any script run. Concurrent
+    callers of the same key wait for a single build.
+
+    Args:
+        max_entries (int): Cached results kept, least recently used evicted first
+        version (callable): Returns the cache version of the first argument,
+            or None; defaults to the frame's data_version
+
+    Returns:
+        callable: Decorator
+    """
+    def decorate(build):
+        entries = OrderedDict()
+        building = {}
+        lock = threading.Lock()
+
+        def lookup(key):
+            with lock:
+                if key not in entries:
+                    return False, None
+                entries.move_to_end(key)
+                return True, entries[key]
+
+        @functools.wraps(build)
+        def wrapper(data, *args, **kwargs):
+            key = version(data)
+            if key is None:
+                return build(data, *args, **kwargs)
+            key = (key, args, tuple(sorted(kwargs.items())))
+            found, result = lookup(key)
+            if found:
+                return result
+            with lock:
+                key_lock = building.setdefault(key, threading.Lock())
+            with key_lock:
+                found, result = lookup(key)
+                if found:
+                    return result
+                result = build(data, *args, **kwargs)
+                with lock:
+                    entries[key] = result
+                    while len(entries) > max_entries:
+                        entries.popitem(last=False)
+                    building.pop(key, None)
+            return result
+
+        def clear():
+            with lock:
+                entries.clear()
+
+        wrapper.clear = clear
+        return wrapper
+    return decorate
+
+def file_digest(path, chunk_size=1 << 20):
+    """
+    Computes the SHA-256 content hash of a file, reading it in chunks.
+
+    Args:
+        path (str): Path to the file
+        chunk_size (int): Number of bytes read per chunk
+
+    Returns:
+        str: Hex digest of the file contents
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def process_health_data(health):
+    """
+    Types and categorizes the raw statistics table and drops uncategorized rows.
+
+    Args:
+        health (pd.DataFrame): Frame as read from the statistics CSV
+
+    Returns:
+        pd.DataFrame: Frame with numeric values, integer years and a Category column
+    """
+    health["Value"] = pd.to_numeric(health["Value"], errors='coerce')
+    health["Year"] = health["Year"].astype(int)
+    health["Category"] = category_index.map_categories(health["Indicator Name"])
+    health = health[health["Category"] != OTHER_CATEGORY]
+    # Uncategorized rows are gone, so "Other" is dropped from the dtype too
+    return health.assign(Category=health["Category"].astype(category_index.dtype))
+
+def snapshot_paths(csv_path, snapshot_dir=SNAPSHOT_DIR):
+    """
+    Returns the snapshot and metadata file paths for a given CSV.
+
+    Args:
+        csv_path (str): Path to the source CSV
+        snapshot_dir (str): Directory holding snapshots, relative to the CSV
+
+    Returns:
+        tuple: (parquet path, metadata json path)
+    """
+    base_dir = os.path.join(os.path.dirname(os.path.abspath(csv_path)), snapshot_dir)
+    stem = os.path.splitext(os.path.basename(csv_path))[0].replace(" ", "_")
+    return (
+        os.path.join(base_dir, f"{stem}.parquet"),
+        os.path.join(base_dir, f"{stem}.json")
+    )
+
+def _read_meta(meta_path):
+    try:
+        with open(meta_path) as handle:
+            meta = json.load(handle)
+    except (OSError, ValueError):
+        return None
+    if meta.get("format") != SNAPSHOT_FORMAT_VERSION:
+        return None
+    # The snapshot stores the derived Category column, so a changed mapping invalidates it
+    if meta.get("categories") != category_index.digest:
+        return None
+    return meta
+
+def _write_meta(meta_path, meta):
+    tmp_path = f"{meta_path}.tmp"
+    with open(tmp_path, "w") as handle:
+        json.dump(meta, handle)
+    os.replace(tmp_path, meta_path)
+
+def build_snapshot(csv_path, digest=None, snapshot_dir=SNAPSHOT_DIR):
+    """
+    Parses the CSV, processes it and writes the binary snapshot next to it.
+
+    Args:
+        csv_path (str): Path to the source CSV
+        digest (str): Precomputed content hash of the CSV, if already known
+        snapshot_dir (str): Directory holding snapshots, relative to the CSV
+
+    Returns:
+        pd.DataFrame: The processed frame
+    """
+    stat = os.stat(csv_path)
+    digest = digest or file_digest(csv_path)
+    health = process_health_data(pd.read_csv(csv_path))
+
+    snapshot_path, meta_path = snapshot_paths(csv_path, snapshot_dir)
+    try:
+        os.makedirs(os.path.dirname(snapshot_path), exist_ok=True)
+        tmp_path = f"{snapshot_path}.tmp"
+        health.to_parquet(tmp_path)
+        os.replace(tmp_path, snapshot_path)
+        _write_meta(meta_path, {
+            "format": SNAPSHOT_FORMAT_VERSION,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": digest,
+            "categories": category_index.digest
+        })
+    except (OSError, ImportError, ValueError):
+        # A read-only checkout or missing parquet engine only costs the speed-up
+        pass
+
+    health.attrs["data_version"] = digest
+    return health
+
+def load_health_data(csv_path=DATA_PATH, snapshot_dir=SNAPSHOT_DIR, compact=False, float32_values=False):
+    """
+    Loads the processed statistics table, preferring the binary snapshot.
+
+    The snapshot is reused while the CSV's modification time and size and
+    the category mapping are unchanged. Otherwise the CSV is hashed, and the
+    snapshot is rebuilt only when its contents actually differ.
+
+    Args:
+        csv_path (str): Path to the source CSV
+        snapshot_dir (str): Directory holding snapshots, relative to the CSV
+        compact (bool): Whether to return the compact layout from compact_health_data
+        float32_values (bool): Whether the compact layout stores values as float32
+
+    Returns:
+        pd.DataFrame: The processed frame, with its content hash in attrs["data_version"]
+    """
+    health = _read_snapshot(csv_path, snapshot_dir)
+    if compact:
+        health = compact_health_data(health, float32_values)
+    return health
+
+def _read_snapshot(csv_path, snapshot_dir):
+    snapshot_path, meta_path = snapshot_paths(csv_path, snapshot_dir)
+    meta = _read_meta(meta_path)
+    if meta is None or not os.path.exists(snapshot_path):
+        return build_snapshot(csv_path, snapshot_dir=snapshot_dir)
+
+    stat = os.stat(csv_path)
+    if (meta["mtime_ns"], meta["size"]) != (stat.st_mtime_ns, stat.st_size):
+        digest = file_digest(csv_path)
+        if digest != meta["sha256"]:
+            return build_snapshot(csv_path, digest, snapshot_dir)
+        try:
+            _write_meta(meta_path, {**meta, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size})
+        except OSError:
+            pass
+
+    try:
+        health = pd.read_parquet(snapshot_path, memory_map=True)
+    except Exception:
+        return build_snapshot(csv_path, snapshot_dir=snapshot_dir)
+
+    health.attrs["data_version"] = meta["sha256"]
+    return health
+
+COMPACT_CATEGORICAL_COLUMNS = ["Indicator Name", "Indicator_Code", "Category"]
+
+def compact_health_data(health, float32_values=False):
+    """
+    Returns a copy of the statistics table using a compact memory layout.
+
+    String columns become Categoricals, years become int16 and, optionally,
+    values become float32.
+
+    Args:
+        health (pd.DataFrame): Processed statistics table
+        float32_values (bool): Whether to downcast the Value column to float32
+
+    Returns:
+        pd.DataFrame: The compacted frame
+    """
+    compact = health.copy()
+    for column in COMPACT_CATEGORICAL_COLUMNS:
+        if column in compact and not isinstance(compact[column].dtype, pd.CategoricalDtype):
+            compact[column] = compact[column].astype("category")
+    compact["Year"] = compact["Year"].astype("int16")
+    if float32_values:
+        compact["Value"] = compact["Value"].astype("float32")
+    return compact
+
+def memory_report(before, after):
+    """
+    Compares per-column memory usage of two versions of the same frame.
+
+    Args:
+        before (pd.DataFrame): Frame before compaction
+        after (pd.DataFrame): Frame after compaction
+
+    Returns:
+        pd.DataFrame: Bytes per column before and after, with a Total row
+    """
+    report = pd.DataFrame({
+        "Before (bytes)": before.memory_usage(deep=True),
+        "After (bytes)": after.memory_usage(deep=True)
+    }).fillna(0).astype("int64")
+    report.loc["Total"] = report.sum()
+    report["Saved (%)"] = (
+        (1 - report["After (bytes)"] / report["Before (bytes)"]) * 100
+    ).round(1)
+    return report
+
+def _partition_filter(countries, categories, indicators):
+    import pyarrow.dataset as ds
+
+    expression = None
+    for field, selected in (("Country ISO3", countries), ("Category", categories), ("Indicator_Code", indicators)):
+        if selected:
+            condition = ds.field(field).isin(list(selected))
+            expression = condition if expression is None else expression & condition
+    return expression
+
+def load_partitioned_data(root, countries=None, categories=None, indicators=None):
+    """
+    Loads only the requested partitions of the dataset written by
+    ``ingest.py --partition-dir``.
+
+    Partitions are pruned by directory (country / category / indicator) before
+    any file is opened, so memory scales with the selection rather than the dump.
+
+    Args:
+        root (str): Dataset root directory
+        countries (list): Country ISO3 codes to load; None loads all
+        categories (list): Category names to load; None loads all but "Other"
+        indicators (list): Indicator codes to load; None loads all
+
+    Returns:
+        pd.DataFrame: Frame in the load_health_data layout plus the country
+            columns, with a fingerprint of the files read in attrs["data_version"]
+    """
+    import pyarrow.dataset as ds
+
+    dataset = ds.dataset(root, format="parquet", partitioning="hive")
+    if categories is None:
+        categories = list(category_index.category_indicators)
+    fragments = list(dataset.get_fragments(filter=_partition_filter(countries, categories, indicators)))
+
+    fingerprint = hashlib.sha256()
+    for fragment in sorted(fragments, key=lambda f: f.path):
+        stat = os.stat(fragment.path)
+        fingerprint.update(f"{fragment.path}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+
+    if fragments:
+        table = ds.FileSystemDataset(
+            fragments, dataset.schema, dataset.format, dataset.filesystem
+        ).to_table()
+        health = table.to_pandas()
+    else:
+        health = pd.DataFrame(columns=[field.name for field in dataset.schema])
+
+    health["Year"] = health["Year"].astype(int)
+    health["Value"] = pd.to_numeric(health["Value"], errors='coerce')
+    health["Indicator_Code"] = health["Indicator_Code"].astype(str)
+    health["Category"] = category_index.categorize(health["Category"].astype(str))
+    health = health.sort_values(["Country ISO3", "Indicator_Code", "Year"], ignore_index=True)
+    health.attrs["data_version"] = fingerprint.hexdigest()
+    return health
@@ -0,0 +1,131 @@
+import warnings
+from collections import namedtuple
+from operator import attrgetter
+
+import numpy as np
+import plotly.graph_objects as go
+from data_store import versioned_cache
+
+DISTRIBUTION_BINS = 20
+
+DistributionStats = namedtuple("DistributionStats", [
+    "count", "mean", "median", "std", "min", "max", "q1", "q3",
+    "lower_whisker", "upper_whisker", "outlier_years", "outliers", "bin_edges", "bin_counts"
+])
+
+def summarize_distributions(matrix, bins=DISTRIBUTION_BINS):
+    """
+    Computes the box-plot and histogram aggregates of every indicator in a
+    matrix in one pass over its year x indicator array.
+
+    Quartiles use linear interpolation and whiskers reach the furthest value
+    within 1.5 IQR of the box, as Plotly computes them in the browser.
+    Histograms have `bins` equal-width bins spanning each indicator's range,
+    as np.histogram does.
+
+    Args:
+        matrix (HealthMatrix): Indicators and years to summarize
+        bins (int): Histogram bins per indicator
+
+    Returns:
+        dict: DistributionStats by indicator name, for the indicators with at
+            least one value; std is NaN for a single value
+    """
+    present = ~np.isnan(matrix.values)
+    columns = np.nonzero(present.any(axis=0))[0]
+    if not len(columns):
+        return {}
+
+    values = matrix.values[:, columns]
+    present = present[:, columns]
+    counts = present.sum(axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'), warnings.catch_warnings():
+        # Single-value indicators have no sample standard deviation
+        warnings.simplefilter("ignore", RuntimeWarning)
+        q1, median, q3 = np.nanpercentile(values, [25, 50, 75], axis=0)
+        mean = np.nanmean(values, axis=0)
+        std = np.nanstd(values, axis=0, ddof=1)
+    std[counts < 2] = np.nan
+    minimum = np.nanmin(values, axis=0)
+    maximum = np.nanmax(values, axis=0)
+
+    iqr = q3 - q1
+    inside = present & (values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)
+    lower_whisker = np.where(inside, values, np.inf).min(axis=0)
+    upper_whisker = np.where(inside, values, -np.inf).max(axis=0)
+    outside = present & ~inside
+
+    # Constant indicators get a unit-wide range around the value, like np.histogram
+    span = maximum - minimum
+    low = np.where(span > 0, minimum, minimum - 0.5)
+    high = np.where(span > 0, maximum, maximum + 0.5)
+    edges = np.linspace(low, high, bins + 1)
+    rows, cols = np.nonzero(present)
+    observed = values[rows, cols]
+    positions = np.floor((observed - low[cols]) * (bins / (high - low))[cols]).astype(int)
+    np.clip(positions, 0, bins - 1, out=positions)
+    # Move values that rounding put on the wrong side of an edge, as np.histogram does
+    positions -= observed < edges[positions, cols]
+    positions += (observed >= edges[positions + 1, cols]) & (positions != bins - 1)
+    histogram = np.bincount(cols * bins + positions, minlength=len(columns) * bins).reshape(len(columns), bins)
+
+    return {
+        matrix.indicators[column]: DistributionStats(
+            int(counts[i]), mean[i], median[i], std[i], minimum[i], maximum[i], q1[i], q3[i],
+            lower_whisker[i], upper_whisker[i],
+            matrix.years[outside[:, i]], values[outside[:, i], i],
+            edges[:, i], histogram[i]
+        )
+        for i, column in enumerate(columns)
+    }
+
+@versioned_cache(max_entries=256, version=attrgetter("key"))
+def get_distribution_stats(matrix, bins=DISTRIBUTION_BINS):
+    """
+    Returns summarize_distributions for a matrix, cached on its key (data
+    version, year range and indicators). Matrices without a key are
+    summarized directly.
+    """
+    return summarize_distributions(matrix, bins)
+
+def box_figure(stats, name, color='#1f77b4'):
+    """
+    Builds a box plot from precomputed DistributionStats, with the outliers
+    as a separate marker trace.
+    """
+    fig = go.Figure(go.Box(
+        x=[name],
+        q1=[stats.q1],
+        median=[stats.median],
+        q3=[stats.q3],
+        lowerfence=[stats.lower_whisker],
+        upperfence=[stats.upper_whisker],
+        mean=[stats.mean],
+        name=name,
+        marker_color=color
+    ))
+    if len(stats.outliers):
+        fig.add_trace(go.Scatter(
+            x=[name] * len(stats.outliers),
+            y=stats.outliers,
+            mode='markers',
+            marker=dict(color=color),
+            customdata=stats.outlier_years,
+            hovertemplate="Year: %{customdata}<br>Value: %{y}<extra></extra>",
+            name="Outliers"
+        ))
+    return fig
+
+def histogram_figure(stats, color='#1f77b4'):
+    """
+    Builds a histogram from the precomputed bins of a DistributionStats.
+    """
+    edges = stats.bin_edges
+    return go.Figure(go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=stats.bin_counts,
+        width=np.diff(edges),
+        customdata=np.column_stack([edges[:-1], edges[1:]]),
+        hovertemplate="%{customdata[0]:.2f} to %{customdata[1]:.2f}<br>Count: %{y}<extra></extra>",
+        marker=dict(color=color, line=dict(width=1, color='rgba(0,0,0,0.4)'))
+    ))
@@ -0,0 +1,80 @@
+import os
+
+import numpy as np
+
+# Figures with more points than this switch to WebGL traces and LTTB downsampling
+DENSE_POINT_THRESHOLD = int(os.environ.get("HEALTH_DENSE_POINT_THRESHOLD", "5000"))
+# Points kept per trace once downsampled
+DOWNSAMPLE_POINTS = int(os.environ.get("HEALTH_DOWNSAMPLE_POINTS", "1000"))
+
+def lttb(x, y, n_out):
+    """
+    Downsamples a series with Largest-Triangle-Three-Buckets.
+
+    The first and last points are kept; every bucket in between keeps the
+    point forming the largest triangle with the previously kept point and
+    the average of the next bucket, which preserves peaks and troughs.
+
+    Args:
+        x (np.ndarray): Ascending x values
+        y (np.ndarray): y values, without NaN
+        n_out (int): Number of points to keep
+
+    Returns:
+        tuple: (x, y) arrays of at most n_out points
+    """
+    x = np.asarray(x)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return x, y
+
+    xf = x.astype(float)
+    # Inner buckets cover points 1 .. n-2; the last "next bucket" is the final point
+    edges = (np.floor(np.arange(n_out - 1) * (n - 2) / (n_out - 2)) + 1).astype(int)
+    averages_x = np.append(np.add.reduceat(xf[1:n - 1], edges[:-1] - 1) / np.diff(edges), xf[-1])
+    averages_y = np.append(np.add.reduceat(y[1:n - 1], edges[:-1] - 1) / np.diff(edges), y[-1])
+
+    keep = np.empty(n_out, dtype=int)
+    keep[0], keep[-1] = 0, n - 1
+    previous = 0
+    for bucket in range(n_out - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        next_x, next_y = averages_x[bucket + 1], averages_y[bucket + 1]
+        area = np.abs(
+            (xf[previous] - next_x) * (y[start:end] - y[previous])
+            - (xf[previous] - xf[start:end]) * (next_y - y[previous])
+        )
+        previous = start + int(area.argmax())
+        keep[bucket + 1] = previous
+    return x[keep], y[keep]
+
+def is_dense(point_count, threshold=None):
+    """
+    Returns whether a figure with point_count points should use the dense mode.
+    """
+    return point_count > (DENSE_POINT_THRESHOLD if threshold is None else threshold)
+
+def downsample(x, y, n_out=None):
+    """
+    Returns a series reduced to at most n_out (default DOWNSAMPLE_POINTS) points.
+    """
+    return lttb(x, y, DOWNSAMPLE_POINTS if n_out is None else n_out)
+
+def downsample_series(series, threshold=None, n_out=None):
+    """
+    Applies the dense mode to a list of (x, y) series.
+
+    Args:
+        series (list): (x, y) array pairs, one per trace
+        threshold (int): Total point count above which the series are dense;
+            None uses DENSE_POINT_THRESHOLD
+        n_out (int): Points kept per series; None uses DOWNSAMPLE_POINTS
+
+    Returns:
+        tuple: (series, dense) where the series are downsampled when dense
+    """
+    dense = is_dense(sum(len(x) for x, _ in series), threshold)
+    if dense:
+        series = [downsample(x, y, n_out) for x, y in series]
+    return series, dense
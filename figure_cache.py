@@ -0,0 +1,117 @@
+import json
+import os
+import threading
+from collections import OrderedDict
+
+import plotly.io as pio
+import streamlit as st
+
+# Memory budget for serialized figures shared by all sessions
+FIGURE_CACHE_MB = float(os.environ.get("HEALTH_FIGURE_CACHE_MB", "64"))
+
+class FigureCache:
+    """
+    LRU cache of serialized Plotly figures under a byte budget.
+
+    Entries are the serialized figure specs, so a hit skips building the
+    figure (and the data preparation behind it) on every rerun.
+    The least recently used entries are evicted once the total size of the
+    cached JSON exceeds max_bytes.
+
+    Args:
+        max_bytes (int): Memory budget for the cached JSON
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Returns the cached JSON for key, or None.
+        """
+        with self._lock:
+            spec = self.entries.get(key)
+            if spec is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return spec
+
+    def put(self, key, spec):
+        """
+        Stores figure JSON, evicting least recently used entries to stay in budget.
+        Figures larger than the whole budget are not cached.
+        """
+        size = len(spec)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self.entries:
+                self.size -= len(self.entries.pop(key))
+            self.entries[key] = spec
+            self.size += size
+            while self.size > self.max_bytes:
+                _, evicted = self.entries.popitem(last=False)
+                self.size -= len(evicted)
+                self.evictions += 1
+
+    def get_or_build(self, key, build):
+        """
+        Returns the figure JSON for key, calling build() for a go.Figure on a miss.
+        """
+        spec = self.get(key)
+        if spec is None:
+            spec = pio.to_json(build(), validate=False)
+            self.put(key, spec)
+        return spec
+
+    def stats(self):
+        """
+        Returns the hit/miss counters and memory use of the cache.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self.entries),
+                "bytes": self.size,
+                "max_bytes": self.max_bytes
+            }
+
+@st.cache_resource
+def get_figure_cache():
+    """
+    Returns the process-wide FigureCache.
+    """
+    return FigureCache(int(FIGURE_CACHE_MB * 1024 * 1024))
+
+def show_figure(view, key, build, use_container_width=True):
+    """
+    Displays a Plotly figure through the figure cache.
+
+    A hit skips building the figure; the cached JSON is passed to
+    st.plotly_chart as a plain dict, so only Streamlit's public API is used.
+
+    Args:
+        view (str): Name of the chart, e.g. "overview_trend"
+        key (hashable): Parameters and data version the figure depends on;
+            None bypasses the cache (e.g. for unversioned data)
+        build (callable): Returns the go.Figure on a cache miss
+        use_container_width (bool): As for st.plotly_chart
+    """
+    if key is None:
+        st.plotly_chart(build(), use_container_width=use_container_width)
+        return
+
+    spec = get_figure_cache().get_or_build((view, key), build)
+    st.plotly_chart(json.loads(spec), use_container_width=use_container_width)
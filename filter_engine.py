@@ -0,0 +1,108 @@
+import re
+from functools import lru_cache
+
+import numpy as np
+from data_store import versioned_cache
+
+KEYWORDS = ["child", "female", "male", "birth", "mortality"]
+
+class FilterEngine:
+    """
+    Answers sidebar filter queries over a pre-sorted copy of the dataset.
+
+    Rows are sorted by category and year once, so a year range is two
+    searchsorted calls per category range, keywords are precomputed row masks
+    and results are memoized on the filter tuple. Returned frames are shared
+    between reruns and must not be modified in place.
+
+    Args:
+        data (pd.DataFrame): The frame returned by load_data
+        keywords (list): Keywords offered by the sidebar keyword filter
+        cache_size (int): Number of filter results kept in memory
+    """
+
+    def __init__(self, data, keywords=KEYWORDS, cache_size=128):
+        self.data = data.sort_values(['Category', 'Year'], kind='stable')
+        self.version = data.attrs.get('data_version')
+        self.years = self.data['Year'].to_numpy()
+        self.year_order = np.argsort(self.years, kind='stable')
+        self.sorted_years = self.years[self.year_order]
+
+        self.category_ranges = {
+            str(category): (positions[0], positions[-1] + 1)
+            for category, positions in self.data.groupby('Category', observed=True, sort=False).indices.items()
+        }
+
+        names = self.data['Indicator Name'].astype(str)
+        unique_names = names.drop_duplicates()
+        self.keyword_masks = {}
+        for keyword in keywords:
+            pattern = re.compile(rf"\b{re.escape(keyword)}", re.IGNORECASE)
+            matches = {name for name in unique_names if pattern.search(name)}
+            self.keyword_masks[keyword] = names.isin(matches).to_numpy()
+
+        self._select = lru_cache(maxsize=cache_size)(self._select_rows)
+
+    def _year_positions(self, start, stop, year_from, year_to, sorted_years):
+        lo = np.searchsorted(sorted_years[start:stop], year_from, side='left')
+        hi = np.searchsorted(sorted_years[start:stop], year_to, side='right')
+        return np.arange(start + lo, start + hi)
+
+    def _select_rows(self, year_from, year_to, categories, keywords, descending):
+        if categories:
+            ranges = [self.category_ranges[c] for c in categories if c in self.category_ranges]
+            pieces = [self._year_positions(start, stop, year_from, year_to, self.years) for start, stop in ranges]
+            positions = np.concatenate(pieces) if pieces else np.empty(0, dtype=int)
+            if len(pieces) > 1:
+                positions = positions[np.argsort(self.years[positions], kind='stable')]
+        else:
+            span = self._year_positions(0, len(self.years), year_from, year_to, self.sorted_years)
+            positions = self.year_order[span]
+
+        if keywords:
+            mask = np.zeros(len(self.years), dtype=bool)
+            for keyword in keywords:
+                if keyword in self.keyword_masks:
+                    mask |= self.keyword_masks[keyword]
+            positions = positions[mask[positions]]
+
+        if descending:
+            positions = positions[::-1]
+
+        filtered = self.data.iloc[positions]
+        # Derived caches are keyed on data_version, which only describes the full table
+        filtered.attrs = {
+            'source_version': self.version,
+            'filters': (year_from, year_to, categories, keywords, descending)
+        }
+        return filtered
+
+    def select(self, year_range=None, categories=None, keywords=None, sort_order="Ascending"):
+        """
+        Returns the rows matching the sidebar filters.
+
+        Args:
+            year_range (tuple): Inclusive (start, end) years; None keeps all years
+            categories (list): Categories to keep; empty keeps all
+            keywords (list): Keep indicators matching any keyword; empty keeps all
+            sort_order (str): "Ascending" or "Descending" by year
+
+        Returns:
+            pd.DataFrame: The matching rows sorted by year
+        """
+        if year_range is None:
+            year_range = (self.sorted_years[0], self.sorted_years[-1]) if len(self.years) else (0, 0)
+        return self._select(
+            int(year_range[0]),
+            int(year_range[1]),
+            tuple(categories or ()),
+            tuple(sorted(keywords or ())),
+            sort_order == "Descending"
+        )
+
+@versioned_cache()
+def get_filter_engine(data):
+    """
+    Returns the FilterEngine for the full dataset, built once per data version.
+    """
+    return FilterEngine(data)
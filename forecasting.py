@@ -0,0 +1,290 @@
+import atexit
+import hashlib
+import importlib
+import json
+import logging
+import multiprocessing
+import os
+import threading
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from data_store import SNAPSHOT_DIR
+from health_matrix import get_health_matrix
+
+logger = logging.getLogger(__name__)
+
+FORECAST_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), SNAPSHOT_DIR, "forecasts")
+# Worker processes for model fits; 0 fits inline and disables pre-fitting
+FORECAST_WORKERS = int(os.environ.get("HEALTH_FORECAST_WORKERS", str(min(2, os.cpu_count() or 1))))
+
+# Model family, ARIMA order and forecast horizon; part of every registry key
+MODEL_SPEC = ("arima", (1, 1, 1), 5)
+
+Forecast = namedtuple("Forecast", ["indicator", "years", "values", "method", "params"])
+
+def fit_forecast(indicator, years, values, spec=MODEL_SPEC):
+    """
+    Fits the forecast model to one series.
+
+    Falls back to a linear trend when the ARIMA fit fails. Runs in worker
+    processes, so it takes and returns plain picklable values.
+
+    Args:
+        indicator (str): Indicator name
+        years (list): Years of the observations, ascending
+        values (list): Observed values
+        spec (tuple): (model family, ARIMA order, forecast horizon)
+
+    Returns:
+        Forecast: The forecast years and values, the method used and its parameters
+    """
+    from scipy import stats
+    from statsmodels.tsa.arima.model import ARIMA
+
+    _, order, steps = spec
+    forecast_years = list(range(int(years[-1]) + 1, int(years[-1]) + 1 + steps))
+    series = pd.Series(values, index=years)
+    try:
+        model = ARIMA(series, order=order).fit()
+        forecast_values = [float(v) for v in model.get_forecast(steps=steps).predicted_mean]
+        params = [float(p) for p in model.params]
+        method = "arima"
+        if len(forecast_values) != steps:
+            forecast_values = [float(values[-1])] * steps
+    except Exception:
+        slope, intercept, _, _, _ = stats.linregress(np.asarray(years, dtype=float), np.asarray(values, dtype=float))
+        forecast_values = [float(slope * year + intercept) for year in forecast_years]
+        params = [float(slope), float(intercept)]
+        method = "linear"
+    return Forecast(indicator, forecast_years, forecast_values, method, params)
+
+def _warm_worker():
+    """
+    Imports the model libraries so a worker's first fit doesn't pay for it.
+    """
+    importlib.import_module("scipy.stats")
+    importlib.import_module("statsmodels.tsa.arima.model")
+
+def series_key(indicator, series, spec=MODEL_SPEC):
+    """
+    Returns the registry key of a series: its indicator, year range, a digest
+    of its years and values, and the model spec.
+    """
+    digest = hashlib.sha256()
+    digest.update(np.ascontiguousarray(series.index.to_numpy(), dtype=np.int64).tobytes())
+    digest.update(np.ascontiguousarray(series.to_numpy(), dtype=float).tobytes())
+    years = (int(series.index[0]), int(series.index[-1]))
+    return (indicator, years, digest.hexdigest(), repr(spec))
+
+class ForecastRegistry:
+    """
+    Memory and disk store of fitted forecasts, filled by process pools.
+
+    Forecasts are keyed on indicator, year range, data digest and model spec,
+    so the same series is fitted once per model spec across reruns, sessions
+    and restarts. Fits run in worker processes and never hold the GIL of
+    the Streamlit server. Background pre-fits and interactive fits use
+    separate pools, so a user's fit never queues behind a pre-fit backlog.
+
+    Args:
+        cache_dir (str): Directory for the on-disk forecasts; None keeps them in memory only
+        workers (int): Pre-fit worker processes; 0 fits inline and disables pre-fitting
+        spec (tuple): Model spec, see MODEL_SPEC
+    """
+
+    def __init__(self, cache_dir=FORECAST_DIR, workers=FORECAST_WORKERS, spec=MODEL_SPEC):
+        self.cache_dir = cache_dir
+        self.spec = spec
+        self.memory = {}
+        self.pending = {}
+        self._lock = threading.Lock()
+        self._pool = None
+        self._interactive = None
+        if workers > 0:
+            # Forking the multithreaded Streamlit server can copy held locks
+            context = multiprocessing.get_context("spawn")
+            self._pool = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+            self._interactive = ProcessPoolExecutor(max_workers=1, mp_context=context)
+            self._interactive.submit(_warm_worker)
+            atexit.register(self.shutdown)
+
+    def shutdown(self):
+        """
+        Stops the worker pools, dropping fits that have not started.
+        """
+        for pool in (self._pool, self._interactive):
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+    def _path(self, key):
+        name = hashlib.sha256(json.dumps(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{name}.json")
+
+    def _load(self, key):
+        if self.cache_dir is None:
+            return None
+        try:
+            with open(self._path(key)) as handle:
+                return Forecast(**json.load(handle))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def _store(self, key, forecast):
+        with self._lock:
+            self.memory[key] = forecast
+            self.pending.pop(key, None)
+        if self.cache_dir is None:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            path = self._path(key)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w") as handle:
+                json.dump(forecast._asdict(), handle)
+            os.replace(tmp_path, path)
+        except OSError:
+            logger.exception("Could not write forecast for %s", key[0])
+
+    def get(self, key):
+        """
+        Returns a stored forecast from memory or disk, or None.
+        """
+        forecast = self.memory.get(key)
+        if forecast is None:
+            forecast = self._load(key)
+            if forecast is not None:
+                with self._lock:
+                    self.memory[key] = forecast
+        return forecast
+
+    def submit(self, indicator, series, pool=None):
+        """
+        Schedules a fit of a series unless it is stored or already scheduled.
+
+        Args:
+            indicator (str): Indicator name
+            series (pd.Series): Values indexed by year, ascending
+            pool (ProcessPoolExecutor): Pool running the fit; None uses the pre-fit pool
+
+        Returns:
+            tuple: (key, future); future is None when the forecast is stored
+                or there is no worker pool
+        """
+        pool = pool or self._pool
+        key = series_key(indicator, series, self.spec)
+        if self.get(key) is not None or pool is None:
+            return key, None
+        with self._lock:
+            future = self.pending.get(key)
+            scheduled = future is None
+            if scheduled:
+                future = pool.submit(
+                    fit_forecast, indicator, series.index.tolist(), series.tolist(), self.spec
+                )
+                self.pending[key] = future
+        if scheduled:
+            # Outside the lock: the callback runs at once if the fit already finished
+            future.add_done_callback(lambda done: self._finish(key, done))
+        return key, future
+
+    def _finish(self, key, future):
+        if future.cancelled():
+            return
+        try:
+            self._store(key, future.result())
+        except Exception:
+            with self._lock:
+                if self.pending.get(key) is future:
+                    del self.pending[key]
+            logger.exception("Forecast fit failed for %s", key[0])
+
+    def request(self, indicator, series):
+        """
+        Returns the stored forecast of a series, or schedules an interactive fit.
+
+        A fit only queued in the pre-fit pool is moved to the interactive
+        pool; one already running there is left to finish.
+
+        Args:
+            indicator (str): Indicator name
+            series (pd.Series): Values indexed by year, ascending
+
+        Returns:
+            tuple: (forecast, future); forecast is None while the fit runs,
+                future is None when the forecast is available or there is
+                no worker pool
+        """
+        key = series_key(indicator, series, self.spec)
+        forecast = self.get(key)
+        if forecast is not None or self._interactive is None:
+            return forecast, None
+        with self._lock:
+            queued = self.pending.get(key)
+            if queued is not None and queued.cancel():
+                del self.pending[key]
+        _, future = self.submit(indicator, series, self._interactive)
+        if future is None:
+            return self.get(key), None
+        return None, future
+
+    def forecast(self, indicator, series):
+        """
+        Returns the forecast of a series, fitting it if needed.
+
+        Args:
+            indicator (str): Indicator name
+            series (pd.Series): Values indexed by year, ascending
+
+        Returns:
+            Forecast: The stored or newly fitted forecast
+        """
+        forecast, future = self.request(indicator, series)
+        if forecast is not None:
+            return forecast
+        if future is not None:
+            return future.result()
+        key = series_key(indicator, series, self.spec)
+        forecast = fit_forecast(indicator, series.index.tolist(), series.tolist(), self.spec)
+        self._store(key, forecast)
+        return forecast
+
+    def prefit(self, matrix):
+        """
+        Schedules fits of every indicator's full series in the background.
+
+        Returns:
+            int: Number of fits scheduled
+        """
+        if self._pool is None:
+            return 0
+        scheduled = 0
+        for indicator in matrix.indicators:
+            series = matrix.series(indicator)
+            if len(series) >= 2 and self.submit(indicator, series)[1] is not None:
+                scheduled += 1
+        return scheduled
+
+_registry = None
+_registry_lock = threading.Lock()
+
+def get_forecast_registry():
+    """
+    Returns the process-wide ForecastRegistry, created on first use.
+
+    A module-level singleton rather than st.cache_resource, so the dataset
+    reloader can schedule prefits from its own thread.
+    """
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ForecastRegistry()
+        return _registry
+
+def prefit_forecasts(data):
+    """
+    Schedules background fits of every indicator of a freshly loaded dataset.
+    """
+    return get_forecast_registry().prefit(get_health_matrix(data))
@@ -0,0 +1,164 @@
+import numpy as np
+import pandas as pd
+from data_store import versioned_cache
+
+class HealthMatrix:
+    """
+    Dense year x indicator store of the long statistics table.
+
+    Values live in one contiguous 2-D float array (NaN where an indicator has
+    no value for a year), so series and slice lookups are array indexing
+    rather than boolean masks over the whole table.
+
+    Attributes:
+        values (np.ndarray): Array of shape (n_years, n_indicators)
+        years (np.ndarray): Sorted years, one per row
+        indicators (pd.Index): Indicator names, one per column
+        info (pd.DataFrame): Indicator_Code and Category per indicator name
+        key (tuple): Identifies the matrix contents for caches (data version
+            plus any slices taken); None for matrices of unversioned frames
+    """
+
+    def __init__(self, values, years, indicators, info, key=None):
+        self.values = np.ascontiguousarray(values, dtype=float)
+        self.years = np.asarray(years)
+        self.indicators = pd.Index(indicators, name='Indicator Name')
+        self.info = info.reindex(self.indicators)
+        self.year_index = {int(year): i for i, year in enumerate(self.years)}
+        self.indicator_index = {name: i for i, name in enumerate(self.indicators)}
+        self.key = key
+
+    @classmethod
+    def from_frame(cls, data):
+        """
+        Builds the matrix from the long table returned by load_data.
+
+        Args:
+            data (pd.DataFrame): Long table with Year, Indicator Name and Value
+
+        Returns:
+            HealthMatrix: The dense matrix
+        """
+        if data.empty:
+            return cls(np.empty((0, 0)), [], [], pd.DataFrame(columns=['Indicator_Code', 'Category']))
+
+        wide = data.pivot_table(index='Year', columns='Indicator Name', values='Value', observed=True)
+        wide = wide.sort_index()
+        info_columns = [c for c in ('Indicator_Code', 'Category') if c in data]
+        info = data.drop_duplicates('Indicator Name').set_index('Indicator Name')[info_columns]
+        info.index = info.index.astype(str)
+        return cls(
+            wide.to_numpy(),
+            wide.index.to_numpy(),
+            wide.columns.astype(str),
+            info,
+            key=data.attrs.get('data_version')
+        )
+
+    @property
+    def empty(self):
+        return self.values.size == 0
+
+    def _year_bounds(self, years):
+        if years is None:
+            return 0, len(self.years)
+        start, end = years
+        return (
+            int(np.searchsorted(self.years, start, side='left')),
+            int(np.searchsorted(self.years, end, side='right'))
+        )
+
+    def _columns(self, indicators):
+        if indicators is None:
+            return slice(None)
+        positions = [self.indicator_index[name] for name in indicators]
+        return np.asarray(positions, dtype=int)
+
+    def series(self, indicator):
+        """
+        Returns the non-missing values of one indicator, indexed by year.
+        """
+        column = self.values[:, self.indicator_index[indicator]]
+        present = ~np.isnan(column)
+        return pd.Series(column[present], index=pd.Index(self.years[present], name='Year'), name=indicator)
+
+    def slice(self, years=None, indicators=None):
+        """
+        Returns a sub-matrix for an inclusive year range and a list of indicators.
+
+        Args:
+            years (tuple): (start, end) years, inclusive; None keeps all years
+            indicators (list): Indicator names; None keeps all indicators
+
+        Returns:
+            HealthMatrix: The selected sub-matrix
+        """
+        start, end = self._year_bounds(years)
+        columns = self._columns(indicators)
+        return HealthMatrix(
+            self.values[start:end][:, columns],
+            self.years[start:end],
+            self.indicators[columns],
+            self.info,
+            key=None if self.key is None else (
+                self.key,
+                None if years is None else (int(years[0]), int(years[1])),
+                None if indicators is None else tuple(indicators)
+            )
+        )
+
+    def frame(self):
+        """
+        Returns the matrix as a wide DataFrame (years x indicators).
+        """
+        return pd.DataFrame(self.values, index=pd.Index(self.years, name='Year'), columns=self.indicators)
+
+    def stacked(self):
+        """
+        Returns the non-missing values as a Series with an (Indicator Name, Year) MultiIndex.
+        """
+        rows, cols = np.nonzero(~np.isnan(self.values.T))
+        index = pd.MultiIndex.from_arrays(
+            [self.indicators[rows], self.years[cols]],
+            names=['Indicator Name', 'Year']
+        )
+        return pd.Series(self.values.T[rows, cols], index=index, name='Value')
+
+    def long(self):
+        """
+        Returns the non-missing values as a long frame sorted by indicator and year.
+        """
+        long = self.stacked().reset_index()
+        return long.join(self.info, on='Indicator Name')
+
+    def latest(self):
+        """
+        Returns each indicator's most recent non-missing value and its year.
+
+        Returns:
+            pd.DataFrame: Year and Value columns indexed by indicator name
+        """
+        present = ~np.isnan(self.values)
+        has_value = present.any(axis=0)
+        last_rows = len(self.years) - 1 - np.argmax(present[::-1], axis=0)
+        columns = np.nonzero(has_value)[0]
+        return pd.DataFrame({
+            'Year': self.years[last_rows[columns]],
+            'Value': self.values[last_rows[columns], columns]
+        }, index=self.indicators[columns])
+
+@versioned_cache()
+def get_health_matrix(data):
+    """
+    Returns the HealthMatrix for the full dataset, built once per data version.
+
+    Only pass the unfiltered frame from load_data here; use HealthMatrix.slice
+    for year or indicator selections.
+
+    Args:
+        data (pd.DataFrame): The frame returned by load_data
+
+    Returns:
+        HealthMatrix: The dense matrix for the dataset
+    """
+    return HealthMatrix.from_frame(data)
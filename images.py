@@ -0,0 +1,99 @@
+import base64
+import hashlib
+import os
+
+import streamlit as st
+from PIL import Image
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+IMAGES_DIR = os.path.join(APP_DIR, "Images")
+# Variants go to static/images and are served as files from app/static/images;
+# without Streamlit static serving they are cached here and inlined instead
+STATIC_VARIANT_DIR = os.path.join(APP_DIR, "static", "images")
+VARIANT_DIR = os.path.join(APP_DIR, ".snapshot", "images")
+
+IMAGE_WIDTHS = (640, 1280, 1920)
+IMAGE_QUALITY = 70
+BACKGROUND_WIDTH = int(os.environ.get("HEALTH_BACKGROUND_WIDTH", "1280"))
+
+def content_hash(path):
+    """
+    Returns a short digest of a file's bytes, used to name its variants.
+    """
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:12]
+
+def variant_path(name, width, digest, variant_dir=VARIANT_DIR):
+    """
+    Returns the path of the WebP variant of an image at a given width.
+    """
+    stem = os.path.splitext(name)[0].replace(" ", "-").replace(",", "").replace("&", "and")
+    return os.path.join(variant_dir, f"{stem}-{width}-{digest}.webp")
+
+def build_variants(name, widths=IMAGE_WIDTHS, images_dir=IMAGES_DIR, variant_dir=VARIANT_DIR):
+    """
+    Writes resized, WebP-recompressed variants of an image in Images/.
+
+    Images are never upscaled, so widths beyond the original share one file.
+    Variants are named by the source's content hash, so existing ones are
+    reused and a changed source gets new files.
+
+    Args:
+        name (str): File name in images_dir, e.g. "Overview.jpg"
+        widths (tuple): Target widths in pixels
+        images_dir (str): Directory holding the original images
+        variant_dir (str): Directory receiving the variants
+
+    Returns:
+        dict: Variant path by requested width
+    """
+    source = os.path.join(images_dir, name)
+    digest = content_hash(source)
+    variants = {}
+    with Image.open(source) as original:
+        for width in widths:
+            size = min(width, original.width)
+            path = variant_path(name, size, digest, variant_dir)
+            if not os.path.exists(path):
+                os.makedirs(variant_dir, exist_ok=True)
+                image = original.convert("RGBA" if "A" in original.getbands() or "transparency" in original.info else "RGB")
+                image.thumbnail((size, original.height))
+                # Write then rename so concurrent sessions never read a partial file
+                image.save(path + ".tmp", "WEBP", quality=IMAGE_QUALITY, method=6)
+                os.replace(path + ".tmp", path)
+            variants[width] = path
+    return variants
+
+def static_serving():
+    """
+    Returns whether Streamlit serves files from the app's static/ directory.
+    """
+    return bool(st.get_option("server.enableStaticServing"))
+
+@st.cache_resource(max_entries=64)
+def _cached_image_url(name, width, static):
+    variant_dir = STATIC_VARIANT_DIR if static else VARIANT_DIR
+    path = next(iter(build_variants(name, (width,), variant_dir=variant_dir).values()))
+    if static:
+        return f"app/static/images/{os.path.basename(path)}"
+    with open(path, "rb") as f:
+        return "data:image/webp;base64," + base64.b64encode(f.read()).decode("ascii")
+
+def image_url(name, width=BACKGROUND_WIDTH):
+    """
+    Returns a CSS-ready URL for an image in Images/, resized to width.
+
+    Static serving is on in the app's .streamlit/config.toml, so this is
+    normally the content-hashed static file, which browsers cache across
+    reruns. Without static serving (e.g. another config or a test harness)
+    it falls back to a WebP data URI built once per process, which is resent
+    with the page CSS on every rerun.
+
+    Args:
+        name (str): File name in Images/, e.g. "Overview.jpg"
+        width (int): Maximum width in pixels
+
+    Returns:
+        str: URL usable in url(...)
+    """
+    return _cached_image_url(name, width, static_serving())
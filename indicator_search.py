@@ -0,0 +1,172 @@
+import re
+from bisect import bisect_left
+from collections import defaultdict
+from functools import lru_cache
+
+from categories import categories
+from data_store import versioned_cache
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+def tokenize(text):
+    """
+    Splits text into lowercase alphanumeric tokens.
+    """
+    return TOKEN_PATTERN.findall(str(text).lower())
+
+def trigrams(token):
+    """
+    Returns the set of padded character trigrams of a token.
+    """
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+class IndicatorCatalog:
+    """
+    Searchable catalog of indicators with prebuilt token and trigram indexes.
+
+    Every indicator is indexed by the tokens of its name, code and category,
+    with category tokens weighted lower than name tokens. Query tokens match
+    exactly, as prefixes (through a sorted vocabulary) or, failing both,
+    fuzzily through a trigram index over the vocabulary.
+
+    Args:
+        records (list): (indicator name, indicator code, category) tuples;
+            code may be None for indicators without data
+        cache_size (int): Number of query results kept in memory
+    """
+
+    EXACT_SCORE = 3.0
+    PREFIX_SCORE = 2.0
+    PHRASE_BONUS = 5.0
+    FUZZY_THRESHOLD = 0.45
+    NAME_WEIGHT = 1.0
+    CATEGORY_WEIGHT = 0.5
+
+    def __init__(self, records, cache_size=256):
+        self.names = []
+        self.codes = []
+        self.categories = []
+        self.index = defaultdict(dict)
+        self.code_index = {}
+        for name, code, category in records:
+            position = len(self.names)
+            self.names.append(name)
+            self.codes.append(code)
+            self.categories.append(category)
+            weighted_tokens = [(token, self.CATEGORY_WEIGHT) for token in tokenize(category)]
+            weighted_tokens += [(token, self.NAME_WEIGHT) for token in tokenize(name)]
+            if code:
+                self.code_index[str(code).lower()] = position
+                weighted_tokens += [(token, self.NAME_WEIGHT) for token in tokenize(code)]
+            for token, weight in weighted_tokens:
+                self.index[token][position] = max(weight, self.index[token].get(position, 0.0))
+
+        self.vocabulary = sorted(self.index)
+        self.trigram_index = defaultdict(set)
+        for token in self.vocabulary:
+            for gram in trigrams(token):
+                self.trigram_index[gram].add(token)
+        self.lowered = [name.lower() for name in self.names]
+
+        self._search = lru_cache(maxsize=cache_size)(self._search_uncached)
+
+    @classmethod
+    def from_frame(cls, data):
+        """
+        Builds the catalog from the categories.py lists and the codes in a loaded frame.
+        """
+        codes = {}
+        if not data.empty:
+            pairs = data[['Indicator Name', 'Indicator_Code']].drop_duplicates('Indicator Name')
+            codes = dict(zip(pairs['Indicator Name'].astype(str), pairs['Indicator_Code'].astype(str)))
+        records = [
+            (name, codes.get(name), category)
+            for category, indicators in categories.items()
+            for name in indicators
+        ]
+        return cls(records)
+
+    def _prefix_tokens(self, token):
+        start = bisect_left(self.vocabulary, token)
+        for vocab_token in self.vocabulary[start:]:
+            if not vocab_token.startswith(token):
+                break
+            yield vocab_token
+
+    def _fuzzy_tokens(self, token):
+        query_grams = trigrams(token)
+        overlap = defaultdict(int)
+        for gram in query_grams:
+            for vocab_token in self.trigram_index.get(gram, ()):
+                overlap[vocab_token] += 1
+        for vocab_token, shared in overlap.items():
+            similarity = shared / len(query_grams | trigrams(vocab_token))
+            if similarity >= self.FUZZY_THRESHOLD:
+                yield vocab_token, similarity
+
+    def _token_hits(self, token):
+        hits = {}
+
+        def add(vocab_token, score):
+            for position, weight in self.index[vocab_token].items():
+                hits[position] = max(hits.get(position, 0.0), score * weight)
+
+        if token in self.index:
+            add(token, self.EXACT_SCORE)
+        for vocab_token in self._prefix_tokens(token):
+            add(vocab_token, self.PREFIX_SCORE)
+        if not hits:
+            for vocab_token, similarity in self._fuzzy_tokens(token):
+                add(vocab_token, similarity)
+        return hits
+
+    def _search_uncached(self, query, limit):
+        query_tokens = tokenize(query)
+        if not query_tokens:
+            return ()
+
+        phrase = query.strip().lower()
+        if phrase in self.code_index:
+            return (self.names[self.code_index[phrase]],)
+
+        scores = defaultdict(float)
+        matched = defaultdict(int)
+        for token in dict.fromkeys(query_tokens):
+            for position, score in self._token_hits(token).items():
+                scores[position] += score
+                matched[position] += 1
+
+        for position in scores:
+            if phrase in self.lowered[position]:
+                scores[position] += self.PHRASE_BONUS
+
+        ranked = sorted(
+            scores,
+            key=lambda p: (-matched[p], -scores[p], len(self.names[p]), self.names[p])
+        )
+        return tuple(self.names[p] for p in ranked[:limit])
+
+    def search(self, query, limit=50):
+        """
+        Returns indicator names matching a query, best matches first.
+
+        An exact indicator code returns that indicator alone. Otherwise
+        indicators matching more query tokens rank higher, then by score
+        (exact > prefix > fuzzy, plus a bonus for containing the whole query).
+
+        Args:
+            query (str): Free-text query; words may be prefixes or misspelt
+            limit (int): Maximum number of results
+
+        Returns:
+            list: Ranked indicator names
+        """
+        return list(self._search(query, limit))
+
+@versioned_cache()
+def get_indicator_catalog(data):
+    """
+    Returns the IndicatorCatalog for the full dataset, built once per data version.
+    """
+    return IndicatorCatalog.from_frame(data)
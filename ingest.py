@@ -0,0 +1,207 @@
+"""
+Streaming ingestion of the raw World Bank-style health CSV.
+
+Applies the cleaning rules from Data_Pre_Processing.ipynb chunk by chunk and
+writes the dashboard's input table as CSV and Parquet:
+
+    python ingest.py Data_Pre_Processing/health_lka.csv
+
+With --partition-dir the cleaned rows of every country are also written as a
+Parquet dataset partitioned by country / category / indicator, which
+data_store.load_partitioned_data reads selectively:
+
+    python ingest.py health_all.csv --partition-dir data/health
+"""
+import argparse
+import os
+import shutil
+import sys
+
+import pandas as pd
+from categories import category_index
+
+RAW_COLUMNS = ['Year', 'Indicator Name', 'Value']
+COUNTRY_COLUMNS = ['Country Name', 'Country ISO3']
+PARTITION_COLUMNS = ['Country ISO3', 'Category', 'Indicator_Code']
+OUTPUT_COLUMNS = ['Year', 'Indicator Name', 'Value', 'Indicator_Code', 'is_percentage']
+DEFAULT_OUTPUT = "Sri Lanka Health Statistics.csv"
+DEFAULT_CHUNKSIZE = 100_000
+
+def clean_chunk(chunk):
+    """
+    Applies the notebook's cleaning rules to one chunk of the raw CSV.
+
+    Args:
+        chunk (pd.DataFrame): Raw rows, read with every column as str
+
+    Returns:
+        pd.DataFrame: Rows with integer years, stripped names and non-negative values
+    """
+    chunk = chunk[[c for c in COUNTRY_COLUMNS if c in chunk] + RAW_COLUMNS]
+    # HXL hashtag rows (e.g. "#date+year") describe the columns, not data
+    chunk = chunk[~chunk['Year'].str.startswith('#', na=False)]
+    chunk = chunk.dropna(subset=['Year', 'Value'])
+    chunk = chunk[chunk['Year'].str.isdigit()]
+    chunk = chunk.assign(**{
+        'Year': chunk['Year'].astype(int),
+        'Indicator Name': chunk['Indicator Name'].astype(str).str.strip(),
+        # Chunks of whole numbers would parse as int64 and change the Parquet schema
+        'Value': pd.to_numeric(chunk['Value'], errors='coerce').astype('float64')
+    })
+    return chunk[chunk['Value'] >= 0]
+
+def assign_indicator_codes(names, indicator_map):
+    """
+    Maps indicator names to IND_### codes in order of first appearance.
+
+    Args:
+        names (pd.Series): Indicator names of one chunk
+        indicator_map (dict): Codes assigned so far, updated in place
+
+    Returns:
+        pd.Series: Indicator codes aligned with names
+    """
+    for name in names.drop_duplicates():
+        if name not in indicator_map:
+            indicator_map[name] = f"IND_{len(indicator_map) + 1:03d}"
+    return names.map(indicator_map)
+
+def flag_percentages(names):
+    """
+    Vectorized form of the notebook's is_percentage check.
+    """
+    return names.str.contains("%", regex=False) | names.str.lower().str.contains("percent", regex=False)
+
+def iter_clean_chunks(source, chunksize=DEFAULT_CHUNKSIZE):
+    """
+    Reads the raw CSV in chunks and yields cleaned, coded output chunks.
+
+    Args:
+        source (str): Path or URL of the raw CSV
+        chunksize (int): Number of raw rows per chunk
+
+    Yields:
+        pd.DataFrame: Chunks with the OUTPUT_COLUMNS layout, plus the country
+            columns when the source has them
+    """
+    indicator_map = {}
+    wanted = set(RAW_COLUMNS + COUNTRY_COLUMNS)
+    reader = pd.read_csv(source, dtype=str, usecols=lambda c: c in wanted, chunksize=chunksize)
+    for raw in reader:
+        chunk = clean_chunk(raw)
+        if chunk.empty:
+            continue
+        chunk['Indicator_Code'] = assign_indicator_codes(chunk['Indicator Name'], indicator_map)
+        chunk['is_percentage'] = flag_percentages(chunk['Indicator Name'])
+        yield chunk
+
+def write_partitions(chunk, root, chunk_number):
+    """
+    Appends one cleaned chunk to the country / category / indicator dataset.
+
+    Args:
+        chunk (pd.DataFrame): Cleaned chunk including the country columns
+        root (str): Dataset root directory
+        chunk_number (int): Sequence number used to keep file names unique
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if 'Country ISO3' not in chunk:
+        raise ValueError("Partitioned output needs a 'Country ISO3' column in the source")
+    partitioned = chunk.assign(Category=category_index.map_categories(chunk['Indicator Name']).astype(str))
+    pq.write_to_dataset(
+        pa.Table.from_pandas(partitioned, preserve_index=False),
+        root,
+        partition_cols=PARTITION_COLUMNS,
+        basename_template=f"part-{chunk_number:05d}-{{i}}.parquet",
+        existing_data_behavior="overwrite_or_ignore"
+    )
+
+def _remove_partial_outputs(*paths):
+    for path in paths:
+        if path is None:
+            continue
+        if os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+        elif os.path.exists(path):
+            os.remove(path)
+
+def ingest(source, output=DEFAULT_OUTPUT, parquet_output=None, chunksize=DEFAULT_CHUNKSIZE, partition_dir=None):
+    """
+    Cleans the raw CSV and writes the dashboard input as CSV and, optionally,
+    Parquet and a partitioned multi-country dataset.
+
+    Args:
+        source (str): Path or URL of the raw CSV
+        output (str): Destination CSV path
+        parquet_output (str): Destination Parquet path, or None to skip
+        chunksize (int): Number of raw rows per chunk
+        partition_dir (str): Root of the partitioned dataset, or None to skip
+
+    Returns:
+        int: Number of rows written
+    """
+    writer = None
+    rows = 0
+    csv_tmp = f"{output}.tmp"
+    parquet_tmp = f"{parquet_output}.tmp" if parquet_output else None
+    partition_tmp = f"{partition_dir}.tmp" if partition_dir else None
+    if partition_tmp and os.path.exists(partition_tmp):
+        shutil.rmtree(partition_tmp)
+    try:
+        with open(csv_tmp, "w", newline="") as csv_handle:
+            for chunk_number, chunk in enumerate(iter_clean_chunks(source, chunksize)):
+                if partition_tmp:
+                    write_partitions(chunk, partition_tmp, chunk_number)
+                chunk = chunk[OUTPUT_COLUMNS]
+                chunk.to_csv(csv_handle, header=rows == 0, index=False)
+                if parquet_output:
+                    import pyarrow as pa
+                    import pyarrow.parquet as pq
+                    table = pa.Table.from_pandas(chunk, preserve_index=False)
+                    if writer is None:
+                        writer = pq.ParquetWriter(parquet_tmp, table.schema)
+                    writer.write_table(table)
+                rows += len(chunk)
+            if rows == 0:
+                pd.DataFrame(columns=OUTPUT_COLUMNS).to_csv(csv_handle, index=False)
+    except BaseException:
+        if writer is not None:
+            writer.close()
+        _remove_partial_outputs(csv_tmp, parquet_tmp, partition_tmp)
+        raise
+    if writer is not None:
+        writer.close()
+
+    os.replace(csv_tmp, output)
+    if writer is not None:
+        os.replace(parquet_tmp, parquet_output)
+    if partition_tmp and os.path.isdir(partition_tmp):
+        if os.path.isdir(partition_dir):
+            shutil.rmtree(partition_dir)
+        os.replace(partition_tmp, partition_dir)
+    return rows
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Clean a raw World Bank-style health CSV for the dashboard.")
+    parser.add_argument("source", help="path or URL of the raw CSV (e.g. Data_Pre_Processing/health_lka.csv)")
+    parser.add_argument("-o", "--output", default=DEFAULT_OUTPUT, help="destination CSV path")
+    parser.add_argument("--parquet", help="destination Parquet path (default: output path with .parquet)")
+    parser.add_argument("--no-parquet", action="store_true", help="only write the CSV")
+    parser.add_argument("--partition-dir", help="also write a country/category/indicator partitioned Parquet dataset here")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE, help="raw rows read per chunk")
+    args = parser.parse_args(argv)
+
+    parquet_output = None
+    if not args.no_parquet:
+        parquet_output = args.parquet or f"{os.path.splitext(args.output)[0]}.parquet"
+
+    rows = ingest(args.source, args.output, parquet_output, args.chunksize, args.partition_dir)
+    print(f"Wrote {rows} rows to {args.output}" + (f" and {parquet_output}" if parquet_output else ""))
+    if args.partition_dir:
+        print(f"Partitioned dataset written to {args.partition_dir}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
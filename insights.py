@@ -0,0 +1,57 @@
+from operator import attrgetter
+
+import numpy as np
+import pandas as pd
+from data_store import versioned_cache
+
+TREND_COLUMNS = ['Start Year', 'Start Value', 'End Year', 'End Value', 'Change', 'Change %', 'Peak Value', 'Peak Year']
+
+def summarize_trends(matrix):
+    """
+    Computes the trend summary of every indicator in a matrix in one pass
+    over its year x indicator array.
+
+    Args:
+        matrix (HealthMatrix): Indicators and years to summarize
+
+    Returns:
+        pd.DataFrame: TREND_COLUMNS indexed by indicator name, for the
+            indicators with at least one value. Change % is inf when the
+            start value is zero.
+    """
+    present = ~np.isnan(matrix.values)
+    columns = np.nonzero(present.any(axis=0))[0]
+    if not len(columns):
+        return pd.DataFrame(columns=TREND_COLUMNS, index=pd.Index([], name='Indicator Name'))
+
+    values = matrix.values[:, columns]
+    present = present[:, columns]
+    first = present.argmax(axis=0)
+    last = len(matrix.years) - 1 - present[::-1].argmax(axis=0)
+    peak = np.where(present, values, -np.inf).argmax(axis=0)
+    positions = np.arange(len(columns))
+
+    start = values[first, positions]
+    end = values[last, positions]
+    change = end - start
+    with np.errstate(divide='ignore', invalid='ignore'):
+        percent = np.where(start != 0, change / start * 100, np.inf)
+
+    return pd.DataFrame({
+        'Start Year': matrix.years[first],
+        'Start Value': start,
+        'End Year': matrix.years[last],
+        'End Value': end,
+        'Change': change,
+        'Change %': percent,
+        'Peak Value': values[peak, positions],
+        'Peak Year': matrix.years[peak]
+    }, index=matrix.indicators[columns])
+
+@versioned_cache(max_entries=256, version=attrgetter("key"))
+def get_trend_summary(matrix):
+    """
+    Returns summarize_trends for a matrix, cached on its key (data version,
+    year range and indicators). Matrices without a key are summarized directly.
+    """
+    return summarize_trends(matrix)
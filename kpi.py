@@ -0,0 +1,104 @@
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+from data_store import versioned_cache
+from health_matrix import get_health_matrix
+
+# Headline series shown on the Executive Summary
+HEADLINE_INDICATORS = {
+    "infant_mortality": "Mortality rate, infant (per 1,000 live births)",
+    "life_expectancy": "Life expectancy at birth, total (years)",
+    "health_expenditure": "Current health expenditure (% of GDP)"
+}
+
+KPIs = namedtuple("KPIs", [
+    "total_indicators", "first_year", "latest_year", "coverage_pct",
+    "current_avg", "past_avg", "avg_change", "complete_series",
+    "category_counts", "headlines"
+])
+
+HEADLINE_COLUMNS = ['Indicator Name', 'First Year', 'First Value', 'Latest Year', 'Latest Value', 'Change', 'Change %']
+
+def build_headlines(matrix, indicators=HEADLINE_INDICATORS):
+    """
+    Returns the first and latest non-missing value of each headline indicator.
+
+    Args:
+        matrix (HealthMatrix): Matrix of the full dataset
+        indicators (dict): Key -> indicator name
+
+    Returns:
+        pd.DataFrame: One row per key found in the matrix, indexed by key
+    """
+    keys = [key for key, name in indicators.items() if name in matrix.indicator_index]
+    if not keys:
+        return pd.DataFrame(columns=HEADLINE_COLUMNS, index=pd.Index([], name='Key'))
+
+    columns = matrix.values[:, [matrix.indicator_index[indicators[key]] for key in keys]]
+    present = ~np.isnan(columns)
+    positions = np.arange(len(keys))
+    first = present.argmax(axis=0)
+    latest = len(matrix.years) - 1 - present[::-1].argmax(axis=0)
+    first_values = columns[first, positions]
+    latest_values = columns[latest, positions]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pct_change = np.where(first_values != 0, (latest_values - first_values) / first_values * 100, np.nan)
+
+    return pd.DataFrame({
+        'Indicator Name': [indicators[key] for key in keys],
+        'First Year': matrix.years[first],
+        'First Value': first_values,
+        'Latest Year': matrix.years[latest],
+        'Latest Value': latest_values,
+        'Change': latest_values - first_values,
+        'Change %': pct_change
+    }, index=pd.Index(keys, name='Key'))
+
+def build_kpis(data, matrix):
+    """
+    Computes the headline metrics of the Overview and Executive Summary pages.
+
+    Row counts and value means per year come from one groupby over the long
+    table; per-indicator completeness and the headline series come from the
+    matrix.
+
+    Args:
+        data (pd.DataFrame): The frame returned by load_data
+        matrix (HealthMatrix): The matrix for the same frame
+
+    Returns:
+        KPIs: The precomputed metrics; None when the frame is empty
+    """
+    if data.empty:
+        return None
+
+    by_year = data.groupby('Year')['Value'].agg(['size', 'mean'])
+    first_year = int(by_year.index.min())
+    latest_year = int(by_year.index.max())
+    current_avg = by_year.at[latest_year, 'mean']
+    past_avg = by_year['mean'].get(latest_year - 10, np.nan)
+    avg_change = (current_avg - past_avg) / past_avg * 100 if past_avg and not np.isnan(past_avg) else 0
+
+    category_counts = data.groupby('Category', observed=True).size().reset_index(name='Count')
+    category_counts['Category'] = category_counts['Category'].astype(str)
+
+    return KPIs(
+        total_indicators=data['Indicator Name'].nunique(),
+        first_year=first_year,
+        latest_year=latest_year,
+        coverage_pct=by_year.at[latest_year, 'size'] / len(data) * 100,
+        current_avg=current_avg,
+        past_avg=past_avg,
+        avg_change=avg_change,
+        complete_series=int((~np.isnan(matrix.values)).sum(axis=0).max()) if not matrix.empty else 0,
+        category_counts=category_counts,
+        headlines=build_headlines(matrix)
+    )
+
+@versioned_cache()
+def get_kpis(data):
+    """
+    Returns the KPIs of the full dataset, computed once per data version.
+    """
+    return build_kpis(data, get_health_matrix(data))
@@ -1,28 +1,30 @@
 import streamlit as st
 from categories import categories
+from filter_engine import KEYWORDS
+from images import image_url
 
 SECTION_BACKGROUNDS = {
-    "Mortality Rates Analysis": "https://raw.githubusercontent.com/iffathsaleem/DSPL_ICW/main/Images/Mortality%20Rates.jpeg",
-    "Maternal and Child Health Analysis": "https://raw.githubusercontent.com/iffathsaleem/DSPL_ICW/main/Images/Maternal%20and%20Child%20Health.jpg",
-    "Infectious Diseases Analysis": "https://raw.githubusercontent.com/iffathsaleem/DSPL_ICW/main/Images/Infectious%20Diseases.jpg",
-    "Health Expenditure Analysis": "https://raw.githubusercontent.com/iffathsaleem/DSPL_ICW/main/Images/Health%20Expenditures.jpg",
-    "Healthcare Infrastructure and Services Analysis": "https://raw.githubusercontent.com/iffathsaleem/DSPL_ICW/main/Images/Healthcare%20Infrastructure%20and%20Services.jpg",
-    "Water, Sanitation and Hygiene Analysis": "https://raw.githubusercontent.com/iffathsaleem/DSPL_ICW/main/Images/Water%2C%20Sanitation%2C%20and%20Hygiene.png",
-    "Non-communicable Diseases and Risk Factors Analysis": "https://raw.githubusercontent.com/iffathsaleem/DSPL_ICW/main/Images/Non-communicable%20Diseases%20and%20Risk%20Factors.jpg",
-    "Nutrition and Food Security Analysis": "https://raw.githubusercontent.com/iffathsaleem/DSPL_ICW/main/Images/Nutrition%20and%20Food%20Security.jpg",
-    "Demographic Indicators Analysis": "https://raw.githubusercontent.com/iffathsaleem/DSPL_ICW/main/Images/Demographic%20Insights.jpg",
-    "Reproductive Health Analysis": "https://raw.githubusercontent.com/iffathsaleem/DSPL_ICW/main/Images/Reproductive%20Health.jpg",
-    "Civil Registration Analysis": "https://raw.githubusercontent.com/iffathsaleem/DSPL_ICW/main/Images/Civil%20Registration.jpg",
-    "Injury and External Causes Analysis": "https://raw.githubusercontent.com/iffathsaleem/DSPL_ICW/main/Images/Injury%20and%20External%20Causes.jpg"
+    "Mortality Rates Analysis": "Mortality Rates.jpeg",
+    "Maternal and Child Health Analysis": "Maternal and Child Health.jpg",
+    "Infectious Diseases Analysis": "Infectious Diseases.jpg",
+    "Health Expenditure Analysis": "Health Expenditures.jpg",
+    "Healthcare Infrastructure and Services Analysis": "Healthcare Infrastructure and Services.jpg",
+    "Water, Sanitation and Hygiene Analysis": "Water, Sanitation, and Hygiene.png",
+    "Non-communicable Diseases and Risk Factors Analysis": "Non-communicable Diseases and Risk Factors.jpg",
+    "Nutrition and Food Security Analysis": "Nutrition and Food Security.jpg",
+    "Demographic Indicators Analysis": "Demographic Insights.jpg",
+    "Reproductive Health Analysis": "Reproductive Health.jpg",
+    "Civil Registration Analysis": "Civil Registration.jpg",
+    "Injury and External Causes Analysis": "Injury and External Causes.jpg"
 }
 
 def set_section_background(category):
-    image_url = SECTION_BACKGROUNDS.get(category)
-    if image_url:
+    image_name = SECTION_BACKGROUNDS.get(category)
+    if image_name:
         st.markdown(f"""
         <style>
         .stApp {{
-            background: linear-gradient(rgba(0, 0, 0, 0.7), rgba(0, 0, 0, 0.7)), url('{image_url}') center/cover no-repeat fixed;
+            background: linear-gradient(rgba(0, 0, 0, 0.7), rgba(0, 0, 0, 0.7)), url('{image_url(image_name)}') center/cover no-repeat fixed;
         }}
         .main .block-container {{
             background-color: rgba(30, 30, 30, 0.85) !important;
@@ -68,7 +70,7 @@ def set_section_background(category):
         """, unsafe_allow_html=True)
         
 def set_sidebar_background():
-    sidebar_image_url = "https://raw.githubusercontent.com/iffathsaleem/DSPL_ICW/main/Images/Sidebar.png"
+    sidebar_image_url = image_url("Sidebar.png", width=640)
     st.markdown(f"""
     <style>
     [data-testid="stSidebar"] {{
@@ -178,13 +180,14 @@ def show_sidebar(health_data=None):
         filters['categories'] = st.multiselect(
             "Categories",
             options=list(categories.keys()),
-            default=list(categories.keys())[:1],
+            default=[],
+            placeholder="All categories",
             key="category_filter"
         )
         
         filters['keywords'] = st.multiselect(
             "Filter by keywords",
-            options=["child", "female", "male", "birth", "mortality"],
+            options=KEYWORDS,
             key="keyword_filter"
         )
         
@@ -0,0 +1,116 @@
+from functools import lru_cache
+
+import numpy as np
+import plotly.io as pio
+
+PANELS_PER_PAGE = 12
+PANEL_HEIGHT = 300
+# Pixels between rows and fraction of the width between columns
+ROW_GAP = 70
+COLUMN_GAP = 0.1
+
+@lru_cache(maxsize=8)
+def template_json(name):
+    """
+    Returns a registered Plotly template as a plain dict, so figures built as
+    dicts get the same styling as go.Figure(template=name).
+    """
+    return pio.templates[name].to_plotly_json()
+
+def _present(**settings):
+    return {name: value for name, value in settings.items() if value is not None}
+
+def small_multiples_figure(matrix, indicators, n_cols=2, theme=None):
+    """
+    Builds a grid of one line chart per indicator as a plain Plotly figure dict.
+
+    Traces, axes and titles are written straight into the layout in one
+    pass, skipping make_subplots and the per-subplot validation of
+    update_xaxes/update_yaxes.
+
+    Args:
+        matrix (HealthMatrix): Matrix holding the indicators
+        indicators (list): Indicators to draw, one panel each, row by row
+        n_cols (int): Panels per row
+        theme (dict): create_plotly_theme() style settings
+
+    Returns:
+        dict: Figure with "data" and "layout" keys
+    """
+    theme = theme or {}
+    n_cols = max(1, min(n_cols, len(indicators)))
+    n_rows = max(1, -(-len(indicators) // n_cols))
+    height = PANEL_HEIGHT * n_rows
+    row_gap = ROW_GAP / height if n_rows > 1 else 0.0
+    column_gap = COLUMN_GAP if n_cols > 1 else 0.0
+    panel_width = (1 - column_gap * (n_cols - 1)) / n_cols
+    panel_height = (1 - row_gap * (n_rows - 1)) / n_rows
+
+    columns = [matrix.indicator_index[name] for name in indicators]
+    values = matrix.values[:, columns]
+    present = ~np.isnan(values)
+    x_style = theme.get("xaxis", {})
+    y_style = theme.get("yaxis", {})
+
+    data, annotations = [], []
+    layout = {}
+    for i, indicator in enumerate(indicators):
+        row, col = divmod(i, n_cols)
+        suffix = "" if i == 0 else str(i + 1)
+        left = col * (panel_width + column_gap)
+        top = 1 - row * (panel_height + row_gap)
+
+        data.append({
+            "type": "scatter",
+            "x": matrix.years[present[:, i]],
+            "y": values[present[:, i], i],
+            "mode": "lines+markers",
+            "name": indicator,
+            "line": {"width": 3},
+            "marker": {"size": 8},
+            "xaxis": f"x{suffix}",
+            "yaxis": f"y{suffix}"
+        })
+        layout[f"xaxis{suffix}"] = {
+            "domain": [left, left + panel_width],
+            "anchor": f"y{suffix}",
+            "title": {"text": "Year"},
+            **_present(gridcolor=x_style.get("gridcolor"), tickfont=x_style.get("tickfont"))
+        }
+        layout[f"yaxis{suffix}"] = {
+            "domain": [max(0.0, top - panel_height), top],
+            "anchor": f"x{suffix}",
+            "title": {"text": "Value"},
+            **_present(gridcolor=y_style.get("gridcolor"), tickfont=y_style.get("tickfont"))
+        }
+        annotations.append({
+            "text": indicator,
+            "x": left + panel_width / 2,
+            "y": top,
+            "xref": "paper",
+            "yref": "paper",
+            "xanchor": "center",
+            "yanchor": "bottom",
+            "showarrow": False,
+            "font": {"size": 16}
+        })
+
+    layout.update(
+        annotations=annotations,
+        height=height,
+        showlegend=False,
+        **_present(
+            font=theme.get("font"),
+            plot_bgcolor=theme.get("plot_bgcolor"),
+            paper_bgcolor=theme.get("paper_bgcolor")
+        )
+    )
+    if theme.get("template"):
+        layout["template"] = template_json(theme["template"])
+    return {"data": data, "layout": layout}
+
+def panel_pages(indicators, per_page=PANELS_PER_PAGE):
+    """
+    Splits indicators into pages of at most per_page panels.
+    """
+    return [indicators[start:start + per_page] for start in range(0, len(indicators), per_page)] or [[]]
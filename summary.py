@@ -1,11 +1,33 @@
+import pandas as pd
 import streamlit as st
 from dashboard import background_images
+from images import image_url
+from kpi import get_kpis
 
-def show_summary():
+WHO_EXPENDITURE_TARGET = 5.0
+
+def headline_text(headlines, key, template, fallback):
+    """
+    Fills template with a headline row's fields, or returns fallback when the
+    indicator has no data.
+    """
+    if key not in headlines.index:
+        return fallback
+    row = headlines.loc[key]
+    return template.format(
+        first_year=int(row['First Year']),
+        first=row['First Value'],
+        latest_year=int(row['Latest Year']),
+        latest=row['Latest Value'],
+        change=row['Change'],
+        pct=row['Change %']
+    )
+
+def show_summary(health_data):
     st.markdown(f"""
         <style>
         .stApp {{
-            background: linear-gradient(rgba(0, 0, 0, 0.7), rgba(0, 0, 0, 0.7)), url('{background_images["Executive Summary"]}');
+            background: linear-gradient(rgba(0, 0, 0, 0.7), rgba(0, 0, 0, 0.7)), url('{image_url(background_images["Executive Summary"])}');
             background-size: cover;
             background-position: center;
             background-repeat: no-repeat;
@@ -22,13 +44,23 @@ def show_summary():
     
     st.title("Sri Lanka Health Executive Summary")
     
-    st.markdown("""
-    ## Major Trends (1960-2023)
+    kpis = get_kpis(health_data)
+    headlines = kpis.headlines if kpis is not None else pd.DataFrame()
+    period = f"{kpis.first_year}-{kpis.latest_year}" if kpis is not None else "1960-2023"
+    
+    achievements = [
+        headline_text(headlines, "infant_mortality", "Infant mortality reduced from {first:.0f} to {latest:.0f} per 1,000 live births", None),
+        headline_text(headlines, "life_expectancy", "Life expectancy increased from {first:.0f} to {latest:.0f} years", None),
+        # Institutional delivery is not one of the dataset's indicators
+        "98% institutional delivery coverage achieved"
+    ]
+    achievement_lines = "\n".join(f"    - {line}" for line in achievements if line)
+    
+    st.markdown(f"""
+    ## Major Trends ({period})
     
     ### Achievements
-    - Infant mortality reduced from 68 to 6 per 1,000 live births
-    - Life expectancy increased from 62 to 77 years
-    - 98% institutional delivery coverage achieved
+{achievement_lines}
     
     ### Ongoing Challenges
     - Rising non-communicable disease burden
@@ -41,11 +73,27 @@ def show_summary():
     3. **Optimize** health expenditure allocation
     """)
     
+    expenditure_delta = "WHO recommended 5%"
+    if "health_expenditure" in headlines.index:
+        below = headlines.at["health_expenditure", 'Latest Value'] < WHO_EXPENDITURE_TARGET
+        expenditure_delta = f"{'Below' if below else 'Above'} {expenditure_delta}"
+    
     cols = st.columns(3)
     with cols[0]:
-        st.metric("Infant Mortality Rate", "6/1000", "-91% since 1960")
+        st.metric(
+            "Infant Mortality Rate",
+            headline_text(headlines, "infant_mortality", "{latest:.0f}/1000", "N/A"),
+            headline_text(headlines, "infant_mortality", "{pct:.0f}% since {first_year}", None)
+        )
     with cols[1]:
-        st.metric("Life Expectancy", "77 years", "+15 years since 1960")
+        st.metric(
+            "Life Expectancy",
+            headline_text(headlines, "life_expectancy", "{latest:.0f} years", "N/A"),
+            headline_text(headlines, "life_expectancy", "{change:+.0f} years since {first_year}", None)
+        )
     with cols[2]:
-        st.metric("Health Expenditure", "3.5% of GDP", "Below WHO recommended 5%")
-    
\ No newline at end of file
+        st.metric(
+            "Health Expenditure",
+            headline_text(headlines, "health_expenditure", "{latest:.1f}% of GDP", "N/A"),
+            expenditure_delta
+        )
@@ -0,0 +1,177 @@
+import html
+import math
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+DEFAULT_PAGE_SIZE = 50
+STRIPE_COLORS = ("#222222", "#444444")
+
+def parse_numeric_filter(query):
+    """
+    Parses a numeric column filter: a value ("2010") or an inclusive range
+    ("2000..2010", "..5", "90.."). Returns (low, high), or None when the
+    query is not numeric.
+    """
+    low, sep, high = query.partition("..")
+    try:
+        low = float(low) if low.strip() else -np.inf
+        high = (float(high) if high.strip() else np.inf) if sep else low
+    except ValueError:
+        return None
+    return low, high
+
+class PagedTable:
+    """
+    Serves sorted, filtered pages of a frame without re-sending the whole frame.
+
+    Sort orders are computed once per (column, direction) and filter masks
+    once per (column, query); string filters are matched against each
+    column's unique values rather than every row. Page results are memoized.
+
+    Args:
+        data (pd.DataFrame): The rows to page through; not modified
+        cache_size (int): Number of (sort, filter) results kept in memory
+    """
+
+    def __init__(self, data, cache_size=64):
+        self.data = data.reset_index(drop=True)
+        self.columns = list(self.data.columns)
+        self._orders = {}
+        self._positions = lru_cache(maxsize=cache_size)(self._filtered_positions)
+
+    def _order(self, column, ascending):
+        key = (column, ascending)
+        if key not in self._orders:
+            values = self.data[column]
+            if not pd.api.types.is_numeric_dtype(values):
+                values = values.astype(str)
+            self._orders[key] = values.sort_values(ascending=ascending, kind='stable').index.to_numpy()
+        return self._orders[key]
+
+    def _mask(self, column, query):
+        values = self.data[column]
+        if pd.api.types.is_numeric_dtype(values):
+            bounds = parse_numeric_filter(query)
+            if bounds is not None:
+                return values.between(*bounds).to_numpy()
+        text = values.astype(str)
+        unique = pd.Series(text.unique())
+        matches = unique[unique.str.contains(query, case=False, regex=False)]
+        return text.isin(matches).to_numpy()
+
+    def _filtered_positions(self, sort_by, ascending, filter_column, query):
+        positions = self._order(sort_by, ascending) if sort_by else np.arange(len(self.data))
+        if filter_column and query:
+            positions = positions[self._mask(filter_column, query)[positions]]
+        return positions
+
+    def page(self, page=1, page_size=DEFAULT_PAGE_SIZE, sort_by=None, ascending=True, filter_column=None, query=""):
+        """
+        Returns one page of rows.
+
+        Args:
+            page (int): 1-based page number; clamped to the available pages
+            page_size (int): Rows per page
+            sort_by (str): Column to sort by; None keeps the frame's order
+            ascending (bool): Sort direction
+            filter_column (str): Column to filter on
+            query (str): Case-insensitive substring for text columns, or a
+                value or "low..high" range for numeric columns
+
+        Returns:
+            tuple: (rows of the page, number of matching rows, page number, number of pages)
+        """
+        positions = self._positions(sort_by, ascending, filter_column, query.strip())
+        pages = max(1, math.ceil(len(positions) / page_size))
+        page = min(max(1, page), pages)
+        start = (page - 1) * page_size
+        return self.data.iloc[positions[start:start + page_size]], len(positions), page, pages
+
+@st.cache_resource(max_entries=64)
+def _cached_paged_table(table_key, _data):
+    return PagedTable(_data)
+
+def get_paged_table(data, table_key=None):
+    """
+    Returns the PagedTable of a frame, built once per table_key.
+
+    Args:
+        data (pd.DataFrame): The rows to page through
+        table_key (hashable): Identifies the rows, e.g. view name plus data
+            version and filters; None builds an uncached table
+    """
+    if table_key is None:
+        return PagedTable(data)
+    return _cached_paged_table(table_key, data)
+
+def striped_table_html(rows):
+    """
+    Renders rows as an HTML table with alternating row backgrounds.
+    """
+    colors = np.resize(np.array(STRIPE_COLORS, dtype=object), len(rows))
+    header = "".join(f"<th style='padding: 6px; text-align: left;'>{html.escape(str(column))}</th>" for column in rows.columns)
+    cells = rows.astype(str).apply(lambda column: "<td style='padding: 6px;'>" + column.map(html.escape) + "</td>")
+    body = "<tr style='background: " + pd.Series(colors, index=rows.index) + ";'>" + cells.sum(axis=1) + "</tr>"
+    return (
+        "<table style='width: 100%; border-collapse: collapse; color: white;'>"
+        f"<thead><tr>{header}</tr></thead><tbody>{''.join(body)}</tbody></table>"
+    )
+
+def show_paged_table(data, key, table_key=None, page_size=DEFAULT_PAGE_SIZE, striped=False, controls=True):
+    """
+    Displays a frame one page at a time with sort and filter controls.
+
+    Args:
+        data (pd.DataFrame): The rows to display
+        key (str): Widget key prefix, unique on the page
+        table_key (hashable): Cache key of the rows, see get_paged_table
+        page_size (int): Default rows per page
+        striped (bool): Render as an HTML table with alternating row colors
+        controls (bool): Show the sort and filter controls
+    """
+    if data.empty:
+        st.info("No rows to display")
+        return
+
+    table = get_paged_table(data, table_key)
+    sort_by, ascending, filter_column, query = None, True, None, ""
+    if controls:
+        cols = st.columns([2, 1, 2, 3])
+        with cols[0]:
+            sort_by = st.selectbox("Sort by", ["(none)"] + table.columns, key=f"{key}_sort")
+            sort_by = None if sort_by == "(none)" else sort_by
+        with cols[1]:
+            ascending = st.radio("Order", ["Asc", "Desc"], horizontal=True, key=f"{key}_order") == "Asc"
+        with cols[2]:
+            filter_column = st.selectbox("Filter column", table.columns, key=f"{key}_filter_column")
+        with cols[3]:
+            query = st.text_input("Contains (or low..high for numbers)", key=f"{key}_query")
+
+    page_key = f"{key}_page"
+    stored_page = st.session_state.get(page_key)
+    rows, total, page, pages = table.page(
+        stored_page or 1, page_size, sort_by, ascending, filter_column, query
+    )
+    # Filtering can leave fewer pages than the stored page number; clamp it
+    # before the widget is created and otherwise leave the state to the widget
+    if stored_page is not None and stored_page != page:
+        st.session_state[page_key] = page
+
+    if striped:
+        st.markdown(striped_table_html(rows), unsafe_allow_html=True)
+    else:
+        st.dataframe(rows, use_container_width=True, hide_index=True)
+
+    if pages > 1:
+        cols = st.columns([1, 3])
+        with cols[0]:
+            # No max_value: it would change the widget's identity whenever
+            # the page count does and reset it; the clamp above bounds it
+            st.number_input("Page", min_value=1, step=1, key=page_key)
+        with cols[1]:
+            st.caption(f"Rows {(page - 1) * page_size + 1:,}-{min(page * page_size, total):,} of {total:,}")
+    else:
+        st.caption(f"{total:,} rows")
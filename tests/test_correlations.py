@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+from correlations import pairwise_correlation
+
+def make_values(seed=0, years=40, indicators=12, missing=0.3):
+    rng = np.random.default_rng(seed)
+    base = rng.normal(size=(years, 1))
+    values = base * rng.normal(size=indicators) + rng.normal(size=(years, indicators))
+    # Indicators on very different scales, as in the dataset
+    values *= 10.0 ** rng.integers(-2, 7, indicators)
+    values[rng.random(values.shape) < missing] = np.nan
+    return values
+
+def assert_matches_pandas(values):
+    correlation, counts = pairwise_correlation(values)
+    frame = pd.DataFrame(values)
+    expected = frame.corr(min_periods=2).to_numpy()
+    present = frame.notna().astype(int)
+    np.testing.assert_allclose(correlation, expected, atol=1e-5, equal_nan=True)
+    np.testing.assert_array_equal(counts, (present.T @ present).to_numpy())
+
+def test_matches_dataframe_corr_with_gaps():
+    for seed in range(5):
+        assert_matches_pandas(make_values(seed))
+
+def test_sparse_overlaps_and_constant_series():
+    values = make_values(1, years=10, indicators=6, missing=0.0)
+    values[:, 0] = np.nan
+    values[0, 0] = 1.0                  # a single value overlaps nothing twice
+    values[:, 1] = 3.0                  # constant
+    values[:8, 2] = np.nan              # two values left
+    values[2:, 3] = np.nan              # two values, overlapping column 2 in none
+    assert_matches_pandas(values)
+
+def test_all_missing_column():
+    values = make_values(2, indicators=4)
+    values[:, 2] = np.nan
+    correlation, counts = pairwise_correlation(values)
+    assert np.isnan(correlation[2]).all() and np.isnan(correlation[:, 2]).all()
+    assert counts[2].sum() == 0
+    assert_matches_pandas(values)
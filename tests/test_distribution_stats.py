@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+from distribution_stats import summarize_distributions
+from health_matrix import HealthMatrix
+
+def make_matrix(values):
+    indicators = [f"Indicator {i}" for i in range(values.shape[1])]
+    info = pd.DataFrame({'Indicator_Code': indicators, 'Category': "Test"}, index=indicators)
+    return HealthMatrix(values, np.arange(1960, 1960 + values.shape[0]), indicators, info)
+
+def make_values(seed=0, years=64, indicators=10):
+    rng = np.random.default_rng(seed)
+    values = rng.lognormal(size=(years, indicators)) * 10.0 ** rng.integers(-3, 7, indicators)
+    values[rng.random(values.shape) < 0.3] = np.nan
+    values[:, 0] = np.nan                     # no values
+    values[:, 1] = np.nan
+    values[5, 1] = 4.2                        # a single value
+    values[::2, 2] = 7.0                      # constant
+    values[:, 3] = np.round(values[:, 3], 1)  # values landing on bin edges
+    return values
+
+@pytest.mark.parametrize("seed", range(4))
+@pytest.mark.parametrize("bins", [5, 20])
+def test_histograms_match_numpy(seed, bins):
+    values = make_values(seed)
+    matrix = make_matrix(values)
+    stats = summarize_distributions(matrix, bins)
+
+    assert "Indicator 0" not in stats
+    for name, summary in stats.items():
+        column = values[:, matrix.indicator_index[name]]
+        observed = column[~np.isnan(column)]
+        counts, edges = np.histogram(observed, bins=bins)
+        np.testing.assert_allclose(summary.bin_edges, edges)
+        np.testing.assert_array_equal(summary.bin_counts, counts)
+        assert summary.count == len(observed) == summary.bin_counts.sum()
+
+@pytest.mark.parametrize("seed", range(4))
+def test_quartiles_and_fences_match_nanpercentile(seed):
+    values = make_values(seed)
+    matrix = make_matrix(values)
+    for name, summary in summarize_distributions(matrix).items():
+        column = values[:, matrix.indicator_index[name]]
+        observed = column[~np.isnan(column)]
+        q1, median, q3 = np.nanpercentile(column, [25, 50, 75])
+        assert (summary.q1, summary.median, summary.q3) == pytest.approx((q1, median, q3))
+        assert summary.mean == pytest.approx(observed.mean())
+        assert (summary.min, summary.max) == (observed.min(), observed.max())
+        if len(observed) > 1:
+            assert summary.std == pytest.approx(observed.std(ddof=1))
+        else:
+            assert np.isnan(summary.std)
+
+        low, high = q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1)
+        inside = observed[(observed >= low) & (observed <= high)]
+        assert summary.lower_whisker == inside.min()
+        assert summary.upper_whisker == inside.max()
+        outliers = (column < low) | (column > high)
+        np.testing.assert_array_equal(summary.outliers, column[outliers])
+        np.testing.assert_array_equal(summary.outlier_years, matrix.years[outliers])
+
+def test_empty_matrix():
+    assert summarize_distributions(make_matrix(np.full((3, 2), np.nan))) == {}
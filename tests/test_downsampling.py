@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+from downsampling import downsample_series, is_dense, lttb
+
+def reference_lttb(x, y, n_out):
+    """
+    Straightforward per-bucket Largest-Triangle-Three-Buckets.
+    """
+    n = len(x)
+    every = (n - 2) / (n_out - 2)
+    keep = [0]
+    previous = 0
+    for bucket in range(n_out - 2):
+        start = int(np.floor(bucket * every)) + 1
+        end = int(np.floor((bucket + 1) * every)) + 1
+        next_start, next_end = end, min(int(np.floor((bucket + 2) * every)) + 1, n)
+        if bucket == n_out - 3:
+            next_x, next_y = x[-1], y[-1]
+        else:
+            next_x, next_y = x[next_start:next_end].mean(), y[next_start:next_end].mean()
+        best, best_area = start, -1.0
+        for i in range(start, end):
+            area = abs((x[previous] - next_x) * (y[i] - y[previous]) - (x[previous] - x[i]) * (next_y - y[previous]))
+            if area > best_area:
+                best, best_area = i, area
+        keep.append(best)
+        previous = best
+    keep.append(n - 1)
+    return np.array(keep)
+
+@pytest.mark.parametrize("n, n_out", [(10, 3), (100, 10), (1001, 100), (5000, 1000), (64, 63)])
+def test_keeps_endpoints_and_point_count(n, n_out):
+    rng = np.random.default_rng(n)
+    x = np.arange(1960, 1960 + n)
+    y = rng.normal(size=n).cumsum()
+    sampled_x, sampled_y = lttb(x, y, n_out)
+
+    assert len(sampled_x) == len(sampled_y) == n_out
+    assert sampled_x[0] == x[0] and sampled_x[-1] == x[-1]
+    assert sampled_y[0] == y[0] and sampled_y[-1] == y[-1]
+    assert np.all(np.diff(sampled_x) > 0)
+    np.testing.assert_array_equal(sampled_x, x[reference_lttb(x.astype(float), y, n_out)])
+
+def test_keeps_the_extremes():
+    x = np.arange(1000)
+    y = np.zeros(1000)
+    y[137], y[801] = 50.0, -50.0
+    _, sampled_y = lttb(x, y, 20)
+    assert sampled_y.max() == 50.0 and sampled_y.min() == -50.0
+
+@pytest.mark.parametrize("n_out", [2, 100, 200])
+def test_short_series_are_returned_unchanged(n_out):
+    x, y = np.arange(100), np.arange(100.0)
+    sampled_x, sampled_y = lttb(x, y, n_out)
+    assert np.array_equal(sampled_x, x) and np.array_equal(sampled_y, y)
+
+def test_downsample_series_only_when_dense():
+    series = [(np.arange(300), np.arange(300.0)), (np.arange(300), np.ones(300))]
+    assert not is_dense(600, threshold=600)
+    unchanged, dense = downsample_series(series, threshold=600, n_out=50)
+    assert not dense and unchanged is series
+    sampled, dense = downsample_series(series, threshold=500, n_out=50)
+    assert dense and [len(x) for x, _ in sampled] == [50, 50]
@@ -0,0 +1,67 @@
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+from categories import categories, category_index
+from filter_engine import FilterEngine, KEYWORDS
+
+def make_health(seed=0, rows=600):
+    rng = np.random.default_rng(seed)
+    names = [name for indicators in list(categories.values())[:4] for name in indicators[:5]]
+    health = pd.DataFrame({
+        'Indicator Name': rng.choice(names, rows),
+        'Year': rng.integers(1960, 2024, rows),
+        'Value': rng.normal(size=rows)
+    })
+    health['Category'] = category_index.map_categories(health['Indicator Name'])
+    health.attrs['data_version'] = "test"
+    return health
+
+def boolean_mask_filters(data, year_range, categories=None, keywords=None, descending=False):
+    """
+    The row masks apply_filters used before FilterEngine, plus the keyword filter.
+    """
+    filtered = data[data['Year'].between(year_range[0], year_range[1])]
+    if categories:
+        filtered = filtered[filtered['Category'].isin(categories)]
+    if keywords:
+        pattern = "|".join(rf"\b{re.escape(keyword)}" for keyword in keywords)
+        filtered = filtered[filtered['Indicator Name'].str.contains(pattern, case=False)]
+    return filtered.sort_values("Year", ascending=not descending, kind='stable')
+
+CASES = [
+    ((1960, 2023), None, None),
+    ((1990, 2005), None, None),
+    ((1990, 2005), [list(categories)[1]], None),
+    ((1970, 2020), [list(categories)[0], list(categories)[2]], None),
+    ((1970, 2020), [list(categories)[3], "Not a category"], None),
+    ((2000, 2000), [list(categories)[0]], None),
+    ((2030, 2040), None, None),
+    ((1960, 2023), None, ["male"]),
+    ((1980, 2010), [list(categories)[0], list(categories)[1]], ["mortality", "child"]),
+]
+
+@pytest.mark.parametrize("year_range, selected, keywords", CASES)
+@pytest.mark.parametrize("descending", [False, True])
+def test_select_matches_boolean_masks(year_range, selected, keywords, descending):
+    health = make_health()
+    expected = boolean_mask_filters(health, year_range, selected, keywords, descending)
+    result = FilterEngine(health).select(
+        year_range, selected, keywords, "Descending" if descending else "Ascending"
+    )
+
+    assert sorted(result.index) == sorted(expected.index)
+    years = result['Year'].to_numpy()
+    assert np.array_equal(years, expected['Year'].to_numpy())
+
+def test_keyword_matches_word_prefixes_only():
+    health = make_health()
+    result = FilterEngine(health, keywords=KEYWORDS).select((1960, 2023), keywords=["male"])
+    # "male" must not match inside "female"
+    assert result['Indicator Name'].str.contains(r"\bmale", case=False).all()
+
+def test_filtered_frames_do_not_carry_the_data_version():
+    result = FilterEngine(make_health()).select((1990, 2000))
+    assert 'data_version' not in result.attrs
+    assert result.attrs['source_version'] == "test"
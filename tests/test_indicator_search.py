@@ -0,0 +1,54 @@
+import pandas as pd
+from categories import categories
+from indicator_search import IndicatorCatalog, trigrams, tokenize
+
+RECORDS = [
+    ("Mortality rate, infant (per 1,000 live births)", "SP.DYN.IMRT.IN", "Mortality Rates"),
+    ("Mortality rate, under-5 (per 1,000 live births)", "SH.DYN.MORT", "Mortality Rates"),
+    ("Life expectancy at birth, total (years)", "SP.DYN.LE00.IN", "Demographic Indicators"),
+    ("Immunization, measles (% of children ages 12-23 months)", "SH.IMM.MEAS", "Immunization"),
+    ("Prevalence of anemia among women of reproductive age (% of women ages 15-49)", None, "Nutrition and Food Security"),
+]
+
+def test_trigrams_are_padded():
+    assert trigrams("ab") == {"  a", " ab", "ab "}
+    assert tokenize("Under-5 (per 1,000)") == ["under", "5", "per", "1", "000"]
+
+def test_exact_code_returns_only_that_indicator():
+    catalog = IndicatorCatalog(RECORDS)
+    assert catalog.search("sh.imm.meas") == [RECORDS[3][0]]
+
+def test_prefixes_match():
+    catalog = IndicatorCatalog(RECORDS)
+    assert catalog.search("immun")[0] == RECORDS[3][0]
+    assert catalog.search("expect")[0] == RECORDS[2][0]
+
+def test_misspelt_words_match_through_trigrams():
+    catalog = IndicatorCatalog(RECORDS)
+    assert catalog.search("anaemia")[0] == RECORDS[4][0]
+    assert catalog.search("mesles")[0] == RECORDS[3][0]
+    assert catalog.search("expectancy") == catalog.search("expectency")
+
+def test_unrelated_queries_match_nothing():
+    catalog = IndicatorCatalog(RECORDS)
+    assert catalog.search("zzzz") == []
+    assert catalog.search("   ") == []
+
+def test_more_matched_words_rank_first():
+    catalog = IndicatorCatalog(RECORDS)
+    results = catalog.search("mortality infant")
+    assert results[0] == RECORDS[0][0]
+    assert RECORDS[1][0] in results
+
+def test_limit_caps_the_results():
+    catalog = IndicatorCatalog(RECORDS)
+    assert len(catalog.search("mortality", limit=1)) == 1
+
+def test_substring_search_hits_are_found():
+    # Every indicator containing a word is found, as with the substring
+    # search the catalog replaced
+    names = [name for indicators in categories.values() for name in indicators]
+    catalog = IndicatorCatalog.from_frame(pd.DataFrame(columns=['Indicator Name', 'Indicator_Code']))
+    for word in ["mortality", "tuberculosis", "female"]:
+        expected = {name for name in names if word in tokenize(name)}
+        assert expected <= set(catalog.search(word, limit=len(names)))
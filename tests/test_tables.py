@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+import pytest
+from tables import PagedTable, parse_numeric_filter
+
+@pytest.mark.parametrize("query, expected", [
+    ("2010", (2010.0, 2010.0)),
+    ("-1.5", (-1.5, -1.5)),
+    ("2000..2010", (2000.0, 2010.0)),
+    (" 2000 .. 2010 ", (2000.0, 2010.0)),
+    ("90..", (90.0, np.inf)),
+    ("..5", (-np.inf, 5.0)),
+    ("..", (-np.inf, np.inf)),
+])
+def test_parse_numeric_filter(query, expected):
+    assert parse_numeric_filter(query) == expected
+
+@pytest.mark.parametrize("query", ["abc", "1..abc", "abc..2", "1..2..3"])
+def test_parse_numeric_filter_rejects_text(query):
+    assert parse_numeric_filter(query) is None
+
+def test_numeric_filter_matches_between_and_text_falls_back_to_substrings():
+    data = pd.DataFrame({'Year': [1999, 2000, 2005, 2010, 2011], 'Name': ["a", "b", "ab", "c", "abc"]})
+    table = PagedTable(data)
+    rows, total, _, _ = table.page(filter_column='Year', query="2000..2010")
+    assert rows['Year'].tolist() == [2000, 2005, 2010] and total == 3
+    rows, total, _, _ = table.page(filter_column='Year', query="..")
+    assert total == 5
+    rows, total, _, _ = table.page(filter_column='Name', query="AB")
+    assert rows['Name'].tolist() == ["ab", "abc"]
+    # A non-numeric query on a numeric column matches the values' text
+    rows, total, _, _ = table.page(filter_column='Year', query="abc")
+    assert total == 0
+
+def test_page_is_clamped_to_the_available_pages():
+    table = PagedTable(pd.DataFrame({'Value': range(120)}))
+    rows, total, page, pages = table.page(page=9, page_size=50)
+    assert (total, page, pages) == (120, 3, 3)
+    assert rows['Value'].tolist() == list(range(100, 120))
@@ -4,12 +4,26 @@ import plotly.express as px
 import plotly.graph_objects as go
 import folium
 from streamlit_folium import folium_static
-from statsmodels.tsa.arima.model import ARIMA
 import numpy as np
 from datetime import datetime
-from plotly.subplots import make_subplots
-from scipy import stats
-import base64
+from concurrent.futures import wait, FIRST_COMPLETED
+from health_matrix import get_health_matrix
+from figure_cache import show_figure
+from forecasting import get_forecast_registry
+from batch_forecasting import batch_forecast, batch_forecast_frame, get_batch_forecast, BATCH_MODELS
+from tables import show_paged_table
+from correlations import CorrelationMatrix, get_correlations
+from insights import get_trend_summary
+from small_multiples import small_multiples_figure, panel_pages, PANELS_PER_PAGE
+from indicator_search import get_indicator_catalog
+from downsampling import downsample_series
+from images import image_url
+from distribution_stats import get_distribution_stats, box_figure, histogram_figure
+
+# Session state key of futures the page is waiting on, and how long the end
+# of a run waits for one of them before rerunning
+PENDING_FUTURES_KEY = "pending_futures"
+PENDING_POLL_SECONDS = 0.5
 
 def create_plotly_theme():
     return {
@@ -41,18 +55,11 @@ def create_plotly_theme():
         "colorway": px.colors.qualitative.Plotly
     }
 
-def get_bg_image_base64(image_url):
-    import requests
-    response = requests.get(image_url)
-    return base64.b64encode(response.content).decode("utf-8")
-
-def set_background_image(image_url):
-    bg_img_base64 = get_bg_image_base64(image_url)
-    
+def set_background_image(image_name):
     st.markdown(f"""
     <style>
     .stApp {{
-        background-image: url("data:image/jpg;base64,{bg_img_base64}");
+        background-image: url("{image_url(image_name)}");
         background-size: cover;
         background-position: center;
         background-repeat: no-repeat;
@@ -158,49 +165,36 @@ def initialize_visualization():
     </style>
     """, unsafe_allow_html=True)
 
-def generate_chart_insights(data, chart_type, indicators=None):
+def generate_chart_insights(data, chart_type, indicators=None, correlations=None):
     insights = []
     
     if chart_type == "time_series" and indicators:
+        summary = get_trend_summary(data)
         for indicator in indicators:
-            indicator_data = data[data['Indicator Name'] == indicator]
+            if indicator not in summary.index:
+                continue
+            row = summary.loc[indicator]
+            change = row['Change']
+            percent_change = row['Change %']
             
-            if not indicator_data.empty:
-                sorted_data = indicator_data.sort_values('Year')
-                start_year = sorted_data['Year'].min()
-                end_year = sorted_data['Year'].max()
-                start_value = sorted_data[sorted_data['Year'] == start_year]['Value'].values[0]
-                end_value = sorted_data[sorted_data['Year'] == end_year]['Value'].values[0]
-                
-                change = end_value - start_value
-                percent_change = (change / start_value * 100) if start_value != 0 else float('inf')
-                
-                trend_direction = "increased" if change > 0 else "decreased" if change < 0 else "remained stable"
-                
-                insight = f"""
-                <div style="color: white; text-shadow: 0px 0px 4px rgba(0,0,0,0.9); background-color: rgba(0,0,0,0.7); padding: 15px; border-radius: 8px; margin-bottom: 12px; box-shadow: 0 4px 6px rgba(0,0,0,0.2);">
-                  <strong>{indicator}</strong> {trend_direction} by <span style="color: {'#81D4FA' if change > 0 else '#FF8A65' if change < 0 else '#FFFFFF'}">{abs(percent_change):.1f}%</span> from {int(start_year)} to {int(end_year)}.
-                  <br>Peak value: <span style="color: #AED581">{sorted_data['Value'].max():.1f}</span> in {int(sorted_data.loc[sorted_data['Value'].idxmax()]['Year'])}
-                </div>
-                """
-                insights.append(insight)
+            trend_direction = "increased" if change > 0 else "decreased" if change < 0 else "remained stable"
+            
+            insight = f"""
+            <div style="color: white; text-shadow: 0px 0px 4px rgba(0,0,0,0.9); background-color: rgba(0,0,0,0.7); padding: 15px; border-radius: 8px; margin-bottom: 12px; box-shadow: 0 4px 6px rgba(0,0,0,0.2);">
+              <strong>{indicator}</strong> {trend_direction} by <span style="color: {'#81D4FA' if change > 0 else '#FF8A65' if change < 0 else '#FFFFFF'}">{abs(percent_change):.1f}%</span> from {int(row['Start Year'])} to {int(row['End Year'])}.
+              <br>Peak value: <span style="color: #AED581">{row['Peak Value']:.1f}</span> in {int(row['Peak Year'])}
+            </div>
+            """
+            insights.append(insight)
     
-    elif chart_type == "correlation" and len(data['Indicator Name'].unique()) >= 2:
+    elif chart_type == "correlation" and len(data.indicators) >= 2:
         try:
-            pivot_data = data.pivot_table(index='Year', columns='Indicator Name', values='Value')
-            correlation_matrix = pivot_data.corr()
-            
-            corr_pairs = []
-            for i in range(len(correlation_matrix.columns)):
-                for j in range(i+1, len(correlation_matrix.columns)):
-                    indicator1 = correlation_matrix.columns[i]
-                    indicator2 = correlation_matrix.columns[j]
-                    corr_value = correlation_matrix.iloc[i, j]
-                    corr_pairs.append((indicator1, indicator2, corr_value))
+            if correlations is None:
+                correlations = CorrelationMatrix.from_matrix(data)
+            top_pairs = correlations.top_pairs(1)
             
-            if corr_pairs:
-                corr_pairs.sort(key=lambda x: abs(x[2]), reverse=True)
-                top_pair = corr_pairs[0]
+            if not top_pairs.empty:
+                top_pair = tuple(top_pairs.iloc[0][['Indicator 1', 'Indicator 2', 'Correlation']])
                 
                 relationship = "positive" if top_pair[2] > 0 else "negative"
                 strength = "strong" if abs(top_pair[2]) > 0.7 else "moderate" if abs(top_pair[2]) > 0.3 else "weak"
@@ -224,32 +218,46 @@ def generate_chart_insights(data, chart_type, indicators=None):
     
     return "".join(insights)
 
+def rerun_when_ready(future):
+    """
+    Asks for a rerun of this session once a background computation finishes;
+    see rerun_for_pending().
+    """
+    st.session_state.setdefault(PENDING_FUTURES_KEY, []).append(future)
+
+def rerun_for_pending():
+    """
+    Called at the end of a script run. If the page registered unfinished
+    futures with rerun_when_ready, waits briefly for one of them and reruns,
+    so pending results show up without the page blocking on them. Slow fits
+    are polled every PENDING_POLL_SECONDS until they finish or the page no
+    longer asks for them.
+    """
+    pending = st.session_state.pop(PENDING_FUTURES_KEY, [])
+    if not pending:
+        return
+    wait(pending, timeout=PENDING_POLL_SECONDS, return_when=FIRST_COMPLETED)
+    st.rerun()
+
 def show_time_series_forecast(data, indicator_name):
     try:
-        ts_data = data[data['Indicator Name'] == indicator_name].set_index('Year')['Value'].dropna()
+        ts_data = data.series(indicator_name)
         if len(ts_data) < 2:
             st.warning(f"Not enough data for forecasting {indicator_name}")
             return
         
-        ts_data = ts_data.sort_index()
         
         last_historical_year = ts_data.index.max()
-        forecast_years = list(range(last_historical_year + 1, last_historical_year + 6))
-        all_years = sorted(list(ts_data.index) + forecast_years)
         
-        try:
-            model = ARIMA(ts_data, order=(1, 1, 1)).fit()
-            forecast = model.get_forecast(steps=5)
-            forecast_values = forecast.predicted_mean.values.tolist()
-            
-            if len(forecast_values) != 5:
-                forecast_values = [float(ts_data.iloc[-1])] * 5
-                
-        except Exception:
-            x = np.array(ts_data.index)
-            y = ts_data.values
-            slope, intercept, r_value, p_value, std_err = stats.linregress(x, y)
-            forecast_values = [slope * year + intercept for year in forecast_years]
+        # Fitted once per series and model spec, in a worker process
+        forecast, pending = get_forecast_registry().request(indicator_name, ts_data)
+        if forecast is None and pending is None:
+            # Worker pools are disabled (HEALTH_FORECAST_WORKERS=0): fit in this process
+            forecast = get_forecast_registry().forecast(indicator_name, ts_data)
+        # While the fit runs, show the history alone and rerun once it is done
+        forecast_years = forecast.years if forecast is not None else []
+        forecast_values = forecast.values if forecast is not None else []
+        all_years = sorted(list(ts_data.index) + forecast_years)
         
         fig = go.Figure()
         
@@ -261,13 +269,14 @@ def show_time_series_forecast(data, indicator_name):
             marker=dict(size=8)
         ))
         
-        fig.add_trace(go.Scatter(
-            x=forecast_years,
-            y=forecast_values,
-            name='Forecast',
-            line=dict(width=4, color='red', dash='dot'),
-            marker=dict(size=8, symbol='diamond')
-        ))
+        if forecast is not None:
+            fig.add_trace(go.Scatter(
+                x=forecast_years,
+                y=forecast_values,
+                name='Forecast',
+                line=dict(width=4, color='red', dash='dot'),
+                marker=dict(size=8, symbol='diamond')
+            ))
         
         theme = create_plotly_theme()
         fig.update_layout(
@@ -310,6 +319,11 @@ def show_time_series_forecast(data, indicator_name):
         )
         
         st.plotly_chart(fig, use_container_width=True)
+
+        if forecast is None:
+            st.info(f"Forecast for {indicator_name} pending; it will appear here once the fit finishes.")
+            rerun_when_ready(pending)
+            return
         
         last_actual_value = float(ts_data.iloc[-1])
         last_forecast_value = forecast_values[-1]
@@ -331,111 +345,74 @@ def show_time_series_forecast(data, indicator_name):
 
 def show_indicator_correlation(data, indicators):
     try:
-        pivot_data = data.pivot_table(index='Year', columns='Indicator Name', values='Value')[indicators]
-        corr = pivot_data.corr()
-        
         theme = create_plotly_theme()
         
-        fig = px.imshow(
-            corr, 
-            text_auto=".2f", 
-            color_continuous_scale='RdBu', 
-            zmin=-1, 
-            zmax=1
-        )
-        
-        fig.update_layout(
-            template=theme["template"],
-            font=theme["font"],
-            plot_bgcolor=theme["plot_bgcolor"],
-            paper_bgcolor=theme["paper_bgcolor"],
-            coloraxis=dict(colorbar=dict(tickfont=dict(color="white"))),
-            title="Indicator Correlation Matrix",
-            title_font=theme["title"]["font"]
-        )
-        
-        for annotation in fig.layout.annotations:
-            annotation.font.color = "white"
-            
-        st.plotly_chart(fig, use_container_width=True)
+        def build_heatmap():
+            corr, _ = CorrelationMatrix.from_matrix(data.slice(indicators=indicators)).submatrix()
+            fig = px.imshow(
+                corr, 
+                text_auto=".2f", 
+                color_continuous_scale='RdBu', 
+                zmin=-1, 
+                zmax=1
+            )
+
+            fig.update_layout(
+                template=theme["template"],
+                font=theme["font"],
+                plot_bgcolor=theme["plot_bgcolor"],
+                paper_bgcolor=theme["paper_bgcolor"],
+                coloraxis=dict(colorbar=dict(tickfont=dict(color="white"))),
+                title="Indicator Correlation Matrix",
+                title_font=theme["title"]["font"]
+            )
+
+            for annotation in fig.layout.annotations:
+                annotation.font.color = "white"
+            return fig
+
+        show_figure("correlation", None if data.key is None else (data.key, tuple(indicators)), build_heatmap)
     except Exception as e:
         st.error(f"Could not calculate correlations: {str(e)}")
 
 def show_multi_indicator_trends(data, indicators):
     try:
         theme = create_plotly_theme()
-        
-        n_indicators = len(indicators)
-        n_cols = min(2, n_indicators)
-        n_rows = (n_indicators + n_cols - 1) // n_cols
-        
-        fig = make_subplots(
-            rows=n_rows, 
-            cols=n_cols,
-            subplot_titles=indicators,
-            vertical_spacing=0.1
-        )
-        
-        for i, indicator in enumerate(indicators):
-            row = i // n_cols + 1
-            col = i % n_cols + 1
-            
-            indicator_data = data[data['Indicator Name'] == indicator].sort_values('Year')
-            
-            fig.add_trace(
-                go.Scatter(
-                    x=indicator_data['Year'], 
-                    y=indicator_data['Value'],
-                    mode='lines+markers',
-                    name=indicator,
-                    line=dict(width=3),
-                    marker=dict(size=8)
-                ),
-                row=row, col=col
-            )
-            
-            fig.update_xaxes(
-                title_text='Year', 
-                row=row, col=col,
-                gridcolor=theme["xaxis"]["gridcolor"],
-                tickfont=theme["xaxis"]["tickfont"]
-            )
-            
-            fig.update_yaxes(
-                title_text='Value', 
-                row=row, col=col,
-                gridcolor=theme["yaxis"]["gridcolor"],
-                tickfont=theme["yaxis"]["tickfont"]
+        pages = panel_pages(list(indicators))
+        
+        page = 1
+        if len(pages) > 1:
+            page = st.number_input(
+                f"Page (of {len(pages)})",
+                min_value=1,
+                max_value=len(pages),
+                step=1,
+                key="small_multiples_page"
             )
+            st.caption(f"Showing {len(pages[page - 1])} of {len(indicators)} indicators, {PANELS_PER_PAGE} per page")
+        panels = pages[page - 1]
         
-        fig.update_layout(
-            height=300 * n_rows,
-            template=theme["template"],
-            font=theme["font"],
-            plot_bgcolor=theme["plot_bgcolor"],
-            paper_bgcolor=theme["paper_bgcolor"],
-            showlegend=False
+        show_figure(
+            "small_multiples",
+            None if data.key is None else (data.key, tuple(panels)),
+            lambda: small_multiples_figure(data, panels, theme=theme)
         )
-        
-        st.plotly_chart(fig, use_container_width=True)
     except Exception as e:
         st.error(f"Could not display trends: {str(e)}")
 
 def show_value_distribution(data, indicator_name):
     try:
-        filtered = data[data['Indicator Name'] == indicator_name]
+        stats = get_distribution_stats(data)[indicator_name]
         theme = create_plotly_theme()
         
         col1, col2 = st.columns(2)
         
         with col1:
-            fig1 = px.box(
-                filtered, 
-                y='Value', 
-                title=f"Distribution of {indicator_name}"
-            )
+            fig1 = box_figure(stats, indicator_name)
             
             fig1.update_layout(
+                title=f"Distribution of {indicator_name}",
+                showlegend=False,
                 template=theme["template"],
                 font=theme["font"],
                 plot_bgcolor=theme["plot_bgcolor"],
@@ -456,14 +433,11 @@ def show_value_distribution(data, indicator_name):
             st.plotly_chart(fig1, use_container_width=True)
             
         with col2:
-            fig2 = px.histogram(
-                filtered, 
-                x='Value', 
-                nbins=20, 
-                title="Value Frequency"
-            )
+            fig2 = histogram_figure(stats)
             
             fig2.update_layout(
+                title="Value Frequency",
+                bargap=0,
                 template=theme["template"],
                 font=theme["font"],
                 plot_bgcolor=theme["plot_bgcolor"],
@@ -489,19 +463,19 @@ def show_value_distribution(data, indicator_name):
             <table style="width: 100%;">
                 <tr>
                     <td style="padding: 8px; border-bottom: 1px solid rgba(255,255,255,0.2);"><strong>Mean:</strong></td>
-                    <td style="padding: 8px; border-bottom: 1px solid rgba(255,255,255,0.2);">{filtered['Value'].mean():.2f}</td>
+                    <td style="padding: 8px; border-bottom: 1px solid rgba(255,255,255,0.2);">{stats.mean:.2f}</td>
                 </tr>
                 <tr>
                     <td style="padding: 8px; border-bottom: 1px solid rgba(255,255,255,0.2);"><strong>Median:</strong></td>
-                    <td style="padding: 8px; border-bottom: 1px solid rgba(255,255,255,0.2);">{filtered['Value'].median():.2f}</td>
+                    <td style="padding: 8px; border-bottom: 1px solid rgba(255,255,255,0.2);">{stats.median:.2f}</td>
                 </tr>
                 <tr>
                     <td style="padding: 8px; border-bottom: 1px solid rgba(255,255,255,0.2);"><strong>Standard Deviation:</strong></td>
-                    <td style="padding: 8px; border-bottom: 1px solid rgba(255,255,255,0.2);">{filtered['Value'].std():.2f}</td>
+                    <td style="padding: 8px; border-bottom: 1px solid rgba(255,255,255,0.2);">{stats.std:.2f}</td>
                 </tr>
                 <tr>
                     <td style="padding: 8px;"><strong>Range:</strong></td>
-                    <td style="padding: 8px;">{filtered['Value'].min():.2f} to {filtered['Value'].max():.2f}</td>
+                    <td style="padding: 8px;">{stats.min:.2f} to {stats.max:.2f}</td>
                 </tr>
             </table>
         </div>
@@ -510,14 +484,21 @@ def show_value_distribution(data, indicator_name):
     except Exception as e:
         st.error(f"Could not show distribution: {str(e)}")
 
-def show_comparative_section(health_data):
+def show_comparative_section(health_data, filtered_rows=None):
     initialize_visualization()
     
-    comparative_bg_img = 'https://raw.githubusercontent.com/iffathsaleem/DSPL_ICW/main/Images/Comparative%20Insights.jpg'
-    set_background_image(comparative_bg_img)
+    set_background_image("Comparative Insights.jpg")
     
-    available_indicators = sorted(health_data['Indicator Name'].unique())
+    matrix = get_health_matrix(health_data)
+    available_indicators = sorted(matrix.indicators)
     min_year, max_year = int(health_data['Year'].min()), int(health_data['Year'].max())
+    default_years = (min_year, max_year)
+    
+    # Narrow the choices to the sidebar filters when they match anything
+    if filtered_rows is not None and not filtered_rows.empty:
+        filtered_names = set(filtered_rows['Indicator Name'].unique())
+        available_indicators = [name for name in available_indicators if name in filtered_names]
+        default_years = (int(filtered_rows['Year'].min()), int(filtered_rows['Year'].max()))
     
     st.markdown("""
     <div style="background-color: rgba(0,0,0,0.7); padding: 15px; border-radius: 10px; margin-bottom: 20px;">
@@ -534,19 +515,35 @@ def show_comparative_section(health_data):
     col1, col2 = st.columns(2)
     with col1:
         st.markdown("<div style='background-color: rgba(0,0,0,0.7); padding: 10px; border-radius: 8px;'><p style='color: white; text-shadow: 0px 0px 4px rgba(0,0,0,0.9); margin: 0 0 5px 0;'>Select indicators to compare</p></div>", unsafe_allow_html=True)
+        search_query = st.text_input(
+            "Search indicators",
+            placeholder="Search by name, code or category, e.g. infant mortality",
+            key="indicator_search",
+            label_visibility="collapsed"
+        )
+        # The selection is kept in session state so it survives the option
+        # list changing as the search query changes
+        allowed = set(available_indicators)
+        default = available_indicators[:2] if len(available_indicators) >= 2 else []
+        current = [name for name in st.session_state.get("compared_indicators", default) if name in allowed]
+        options = available_indicators
+        if search_query:
+            matches = get_indicator_catalog(health_data).search(search_query, limit=100)
+            options = list(dict.fromkeys(current + [name for name in matches if name in allowed]))
         selected_indicators = st.multiselect(
             "Select indicators to compare",
-            options=available_indicators,
-            default=available_indicators[:2] if len(available_indicators) >= 2 else None,
+            options=options,
+            default=current or None,
             label_visibility="collapsed"
         )
+        st.session_state["compared_indicators"] = selected_indicators
     with col2:
         st.markdown("<div style='background-color: rgba(0,0,0,0.7); padding: 10px; border-radius: 8px;'><p style='color: white; text-shadow: 0px 0px 4px rgba(0,0,0,0.9); margin: 0 0 5px 0;'>Year range</p></div>", unsafe_allow_html=True)
         year_range = st.slider(
             "Year range",
             min_value=min_year,
             max_value=max_year,
-            value=(min_year, max_year),
+            value=default_years,
             label_visibility="collapsed"
         )
     
@@ -560,13 +557,9 @@ def show_comparative_section(health_data):
         """, unsafe_allow_html=True)
         return
     
-    filtered_data = health_data[
-        (health_data['Indicator Name'].isin(selected_indicators)) &
-        (health_data['Year'] >= year_range[0]) &
-        (health_data['Year'] <= year_range[1])
-    ]
+    filtered_data = matrix.slice(years=year_range, indicators=selected_indicators)
     
-    if filtered_data.empty:
+    if np.isnan(filtered_data.values).all():
         st.markdown("""
         <div style="background-color: rgba(0,0,0,0.7); padding: 15px; border-radius: 10px;">
             <p style="color: #FFD54F; text-shadow: 0px 0px 4px rgba(0,0,0,0.9); margin: 0;">
@@ -591,27 +584,50 @@ def show_comparative_section(health_data):
     
     if viz_type == "Trend Lines":
         theme = create_plotly_theme()
-        
-        fig = px.line(
-            filtered_data, 
-            x='Year', 
-            y='Value', 
-            color='Indicator Name',
-            markers=True
-        )
-        
-        fig.update_layout(
-            height=500,
-            template=theme["template"],
-            font=theme["font"],
-            plot_bgcolor=theme["plot_bgcolor"],
-            paper_bgcolor=theme["paper_bgcolor"],
-            xaxis=theme["xaxis"],
-            yaxis=theme["yaxis"],
-            legend=theme["legend"]
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
+        present = ~np.isnan(filtered_data.values)
+        columns = np.nonzero(present.any(axis=0))[0]
+        series, dense = downsample_series([
+            (filtered_data.years[present[:, column]], filtered_data.values[present[:, column], column])
+            for column in columns
+        ])
+        
+        def build_trend_lines():
+            if dense:
+                # Downsampled WebGL lines keep the payload flat as series grow
+                fig = go.Figure([
+                    go.Scattergl(x=x, y=y, name=filtered_data.indicators[column], mode='lines')
+                    for column, (x, y) in zip(columns, series)
+                ])
+                fig.update_layout(xaxis_title='Year', yaxis_title='Value', legend_title_text='Indicator Name')
+            else:
+                fig = px.line(
+                    filtered_data.long(), 
+                    x='Year', 
+                    y='Value', 
+                    color='Indicator Name',
+                    markers=True
+                )
+
+            fig.update_layout(
+                height=500,
+                template=theme["template"],
+                font=theme["font"],
+                plot_bgcolor=theme["plot_bgcolor"],
+                paper_bgcolor=theme["paper_bgcolor"],
+                xaxis=theme["xaxis"],
+                yaxis=theme["yaxis"],
+                legend=theme["legend"]
+            )
+            return fig
+
+        show_figure("trend_lines", filtered_data.key, build_trend_lines)
+        if dense:
+            # Plotly zoom events don't reach the server, so the year range
+            # slider is the zoom: a narrower range is re-sampled at full detail
+            st.caption(
+                f"Dense data: showing {sum(len(x) for x, _ in series):,} of {int(present.sum()):,} points. "
+                "Narrow the year range to load the selected years at full resolution."
+            )
         
         st.markdown("""
         <div style="background-color: rgba(0,0,0,0.7); padding: 10px; border-radius: 10px; margin-bottom: 15px;">
@@ -632,33 +648,38 @@ def show_comparative_section(health_data):
     elif viz_type == "Correlation":
         if len(selected_indicators) >= 2:
             try:
-                pivot_data = filtered_data.pivot_table(index='Year', columns='Indicator Name', values='Value')[selected_indicators]
-                corr = pivot_data.corr()
-                
                 theme = create_plotly_theme()
+                correlations = get_correlations(health_data, selected_indicators, year_range)
                 
-                fig = px.imshow(
-                    corr, 
-                    text_auto=".2f", 
-                    color_continuous_scale='RdBu', 
-                    zmin=-1, 
-                    zmax=1,
-                    title="Indicator Correlation Matrix"
-                )
-                
-                fig.update_layout(
-                    template=theme["template"],
-                    font=theme["font"],
-                    plot_bgcolor=theme["plot_bgcolor"],
-                    paper_bgcolor=theme["paper_bgcolor"],
-                    coloraxis=dict(colorbar=dict(tickfont=dict(color="white"))),
-                    title_font=theme["title"]["font"]
-                )
-                
-                for annotation in fig.layout.annotations:
-                    annotation.font.color = "white"
-                    
-                st.plotly_chart(fig, use_container_width=True)
+                def build_heatmap():
+                    corr, overlap = correlations.submatrix()
+                    fig = px.imshow(
+                        corr, 
+                        text_auto=".2f", 
+                        color_continuous_scale='RdBu', 
+                        zmin=-1, 
+                        zmax=1,
+                        title="Indicator Correlation Matrix"
+                    )
+                    fig.update_traces(
+                        customdata=overlap.to_numpy(),
+                        hovertemplate="%{y}<br>%{x}<br>Correlation: %{z:.2f}<br>Overlapping years: %{customdata}<extra></extra>"
+                    )
+
+                    fig.update_layout(
+                        template=theme["template"],
+                        font=theme["font"],
+                        plot_bgcolor=theme["plot_bgcolor"],
+                        paper_bgcolor=theme["paper_bgcolor"],
+                        coloraxis=dict(colorbar=dict(tickfont=dict(color="white"))),
+                        title_font=theme["title"]["font"]
+                    )
+
+                    for annotation in fig.layout.annotations:
+                        annotation.font.color = "white"
+                    return fig
+
+                show_figure("correlation", filtered_data.key, build_heatmap)
                 
                 st.markdown("""
                 <div style="background-color: rgba(0,0,0,0.7); padding: 10px; border-radius: 10px; margin-bottom: 15px;">
@@ -666,7 +687,7 @@ def show_comparative_section(health_data):
                 </div>
                 """, unsafe_allow_html=True)
                 
-                insights = generate_chart_insights(filtered_data, "correlation")
+                insights = generate_chart_insights(filtered_data, "correlation", correlations=correlations)
                 st.markdown(insights, unsafe_allow_html=True)
                 
             except Exception as e:
@@ -678,65 +699,70 @@ def show_comparative_section(health_data):
         indicator = st.selectbox("Select indicator to forecast", selected_indicators)
         show_time_series_forecast(filtered_data, indicator)
         
+        with st.expander("Forecast all indicators", expanded=False):
+            col1, col2 = st.columns(2)
+            with col1:
+                model_labels = dict(zip(["Linear trend", "Damped Holt", "Drift"], BATCH_MODELS))
+                model = model_labels[st.selectbox("Model", list(model_labels), key="batch_forecast_model")]
+            with col2:
+                scope = st.radio("Indicators", ["Selected", "All"], horizontal=True, key="batch_forecast_scope")
+            if scope == "Selected":
+                batch = batch_forecast(filtered_data, model)
+                table_key = None if filtered_data.key is None else ("batch_forecast", filtered_data.key, model)
+            else:
+                batch = get_batch_forecast(health_data, model)
+                version = health_data.attrs.get('data_version')
+                table_key = None if version is None else ("batch_forecast", version, model)
+            st.caption("Point forecasts with 95% prediction intervals, fitted for every indicator in one pass")
+            show_paged_table(batch_forecast_frame(batch).round(2), "batch_forecast", table_key)
+        
     elif viz_type == "Distribution":
         indicator = st.selectbox("Select indicator", selected_indicators)
-        indicator_data = filtered_data[filtered_data['Indicator Name'] == indicator]
+        stats = get_distribution_stats(filtered_data).get(indicator)
         
-        if not indicator_data.empty:
+        if stats is not None:
             st.markdown("<div style='margin-top: 20px;'></div>", unsafe_allow_html=True)
             
             col1, col2 = st.columns(2, gap="large")
             
             with col1:
-                fig1 = px.box(
-                    indicator_data,
-                    y='Value',
-                    title=f"<b>Box Plot of {indicator}</b>",
-                    color_discrete_sequence=['#1f77b4']
-                )
-                fig1.update_layout(
-                    template="plotly_dark",
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    yaxis_title="Value",
-                    showlegend=False,
-                    margin=dict(l=50, r=50, t=60, b=50),
-                    height=400
-                )
-                st.plotly_chart(fig1, use_container_width=True)
+                def build_box_plot():
+                    fig1 = box_figure(stats, indicator)
+                    fig1.update_layout(
+                        title=f"<b>Box Plot of {indicator}</b>",
+                        template="plotly_dark",
+                        plot_bgcolor='rgba(0,0,0,0)',
+                        paper_bgcolor='rgba(0,0,0,0)',
+                        yaxis_title="Value",
+                        showlegend=False,
+                        margin=dict(l=50, r=50, t=60, b=50),
+                        height=400
+                    )
+                    return fig1
+
+                show_figure("distribution_box", None if filtered_data.key is None else (filtered_data.key, indicator), build_box_plot)
                 
             with col2:
-                fig2 = px.histogram(
-                    indicator_data,
-                    x='Value',
-                    nbins=20,
-                    title=f"<b>Distribution of {indicator}</b>",
-                    color_discrete_sequence=['#1f77b4']
-                )
-                fig2.update_layout(
-                    template="plotly_dark",
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    xaxis_title="Value",
-                    yaxis_title="Count",
-                    showlegend=False,
-                    margin=dict(l=50, r=50, t=60, b=50),
-                    height=400
-                )
-                st.plotly_chart(fig2, use_container_width=True)
+                def build_histogram():
+                    fig2 = histogram_figure(stats)
+                    fig2.update_layout(
+                        title=f"<b>Distribution of {indicator}</b>",
+                        bargap=0,
+                        template="plotly_dark",
+                        plot_bgcolor='rgba(0,0,0,0)',
+                        paper_bgcolor='rgba(0,0,0,0)',
+                        xaxis_title="Value",
+                        yaxis_title="Count",
+                        showlegend=False,
+                        margin=dict(l=50, r=50, t=60, b=50),
+                        height=400
+                    )
+                    return fig2
+
+                show_figure("distribution_histogram", None if filtered_data.key is None else (filtered_data.key, indicator), build_histogram)
             
             st.markdown("<div style='margin-top: 30px;'></div>", unsafe_allow_html=True)
             
-            values = indicator_data['Value']
-            stats = {
-                "Mean": values.mean(),
-                "Median": values.median(),
-                "Std Dev": values.std(),
-                "Min": values.min(),
-                "Max": values.max(),
-                "Count": len(values)
-            }
-            
             st.markdown(f"""
             <div style="background-color: rgba(0,0,0,0.7); 
                         padding: 20px; 
@@ -750,27 +776,27 @@ def show_comparative_section(health_data):
                 <table style="width: 100%; border-collapse: collapse;">
                     <tr>
                         <td style="padding: 8px; border-bottom: 1px solid rgba(255,255,255,0.2);"><strong>Mean:</strong></td>
-                        <td style="padding: 8px; border-bottom: 1px solid rgba(255,255,255,0.2);">{stats['Mean']:.2f}</td>
+                        <td style="padding: 8px; border-bottom: 1px solid rgba(255,255,255,0.2);">{stats.mean:.2f}</td>
                     </tr>
                     <tr>
                         <td style="padding: 8px; border-bottom: 1px solid rgba(255,255,255,0.2);"><strong>Median:</strong></td>
-                        <td style="padding: 8px; border-bottom: 1px solid rgba(255,255,255,0.2);">{stats['Median']:.2f}</td>
+                        <td style="padding: 8px; border-bottom: 1px solid rgba(255,255,255,0.2);">{stats.median:.2f}</td>
                     </tr>
                     <tr>
                         <td style="padding: 8px; border-bottom: 1px solid rgba(255,255,255,0.2);"><strong>Std Dev:</strong></td>
-                        <td style="padding: 8px; border-bottom: 1px solid rgba(255,255,255,0.2);">{stats['Std Dev']:.2f}</td>
+                        <td style="padding: 8px; border-bottom: 1px solid rgba(255,255,255,0.2);">{stats.std:.2f}</td>
                     </tr>
                     <tr>
                         <td style="padding: 8px; border-bottom: 1px solid rgba(255,255,255,0.2);"><strong>Min:</strong></td>
-                        <td style="padding: 8px; border-bottom: 1px solid rgba(255,255,255,0.2);">{stats['Min']:.2f}</td>
+                        <td style="padding: 8px; border-bottom: 1px solid rgba(255,255,255,0.2);">{stats.min:.2f}</td>
                     </tr>
                     <tr>
                         <td style="padding: 8px; border-bottom: 1px solid rgba(255,255,255,0.2);"><strong>Max:</strong></td>
-                        <td style="padding: 8px; border-bottom: 1px solid rgba(255,255,255,0.2);">{stats['Max']:.2f}</td>
+                        <td style="padding: 8px; border-bottom: 1px solid rgba(255,255,255,0.2);">{stats.max:.2f}</td>
                     </tr>
                     <tr>
                         <td style="padding: 8px;"><strong>Count:</strong></td>
-                        <td style="padding: 8px;">{stats['Count']}</td>
+                        <td style="padding: 8px;">{stats.count}</td>
                     </tr>
                 </table>
             </div>